@@ -42,9 +42,17 @@ from .storage import StorageManager, StorageError
 from .task_classifier import TaskClassifier, ClassificationResult
 from .learning_engine import LearningEngine, PerformanceReport
 from .adaptive_router import AdaptiveRouter, RoutingDecision
-from .parallel_executor import ParallelExecutor, ExecutionResult
+from .parallel_executor import ParallelExecutor, ExecutionResult, install_event_loop_policy
 from .merger import ConfidenceWeightedMerger, MergeMetadata
-from .cache import ResponseCache, SemanticCache, CacheEntry, CacheStats, create_cache
+from .cache import (
+    ResponseCache,
+    ShardedResponseCache,
+    ValueAwareCache,
+    SemanticCache,
+    CacheEntry,
+    CacheStats,
+    create_cache,
+)
 from .async_storage import AsyncStorageManager
 
 __all__ = [
@@ -57,6 +65,7 @@ __all__ = [
     "RoutingDecision",
     "ParallelExecutor",
     "ExecutionResult",
+    "install_event_loop_policy",
     "ConfidenceWeightedMerger",
     "MergeMetadata",
     "TaskType",
@@ -77,6 +86,8 @@ __all__ = [
     "validate_positive_number",
     "validate_non_empty_string",
     "ResponseCache",
+    "ShardedResponseCache",
+    "ValueAwareCache",
     "SemanticCache",
     "CacheEntry",
     "CacheStats",
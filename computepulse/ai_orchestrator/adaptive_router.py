@@ -5,26 +5,99 @@ This module implements intelligent model selection based on task type,
 confidence scores, cost constraints, and routing strategies.
 """
 
+import json
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from .models import AIModel, TaskType, RoutingStrategy
 from .learning_engine import LearningEngine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _format_reason(
+    strategy: RoutingStrategy,
+    selected: Sequence[str],
+    model_scores: Dict[str, float],
+    threshold: float,
+) -> str:
+    """Build explanation for routing decision."""
+    if not selected:
+        return "No models selected"
+    
+    scores_str = ", ".join(
+        f"{name}={model_scores.get(name, 0.5):.2f}"
+        for name in selected
+    )
+    
+    return f"Strategy: {strategy.value}, Models: {scores_str}, Threshold: {threshold:.2f}"
+
+
 class RoutingDecision:
-    """Result of routing decision."""
-    models: List[str]
-    strategy: RoutingStrategy
-    task_type: TaskType
-    confidence_scores: Dict[str, float]
-    estimated_cost: float
-    reason: str
+    """
+    Result of routing decision.
+    
+    The human-readable ``reason`` is diagnostic only, so it can be passed
+    either as a string or as a ``(strategy, selected, model_scores, threshold)``
+    context tuple that is formatted on first access.
+    """
+    __slots__ = (
+        "models", "strategy", "task_type", "confidence_scores", "estimated_cost",
+        "_reason", "_reason_ctx",
+    )
+    
+    def __init__(
+        self,
+        models: List[str],
+        strategy: RoutingStrategy,
+        task_type: TaskType,
+        confidence_scores: Dict[str, float],
+        estimated_cost: float,
+        reason: Optional[str] = None,
+        reason_ctx: Optional[Tuple[RoutingStrategy, Tuple[str, ...], Dict[str, float], float]] = None,
+    ):
+        self.models = models
+        self.strategy = strategy
+        self.task_type = task_type
+        self.confidence_scores = confidence_scores
+        self.estimated_cost = estimated_cost
+        self._reason = reason
+        self._reason_ctx = reason_ctx
+    
+    @property
+    def reason(self) -> str:
+        """Explanation of the decision, formatted lazily."""
+        if self._reason is None:
+            self._reason = _format_reason(*self._reason_ctx) if self._reason_ctx else ""
+            self._reason_ctx = None
+        return self._reason
+    
+    def _astuple(self) -> tuple:
+        return (
+            self.models, self.strategy, self.task_type,
+            self.confidence_scores, self.estimated_cost, self.reason,
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+    
+    # Mutable and compared by value, like an eq=True dataclass
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (
+            f"RoutingDecision(models={self.models!r}, strategy={self.strategy!r}, "
+            f"task_type={self.task_type!r}, confidence_scores={self.confidence_scores!r}, "
+            f"estimated_cost={self.estimated_cost!r}, reason={self.reason!r})"
+        )
     
     def to_dict(self) -> dict:
         return {
@@ -35,6 +108,12 @@ class RoutingDecision:
             "estimated_cost": self.estimated_cost,
             "reason": self.reason,
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize directly to JSON bytes."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8")
 
 
 class AdaptiveRouter:
@@ -128,23 +207,18 @@ class AdaptiveRouter:
             limit,
         )
         
-        # Calculate estimated cost
-        estimated_cost = sum(
-            self.available_models[name].cost_per_1m_tokens * 0.001  # Assume ~1000 tokens
-            for name in selected
-            if name in self.available_models
-        )
-        
-        # Build reason string
-        reason = self._build_reason(routing_strategy, selected, model_scores, threshold)
+        # Calculate estimated cost (selected names all come from enabled_models)
+        estimated_cost = sum(enabled_models[name].cost_per_request for name in selected)
         
+        confidence_scores = {name: model_scores.get(name, 0.5) for name in selected}
         return RoutingDecision(
             models=selected,
             strategy=routing_strategy,
             task_type=task_type,
-            confidence_scores={name: model_scores.get(name, 0.5) for name in selected},
+            confidence_scores=confidence_scores,
             estimated_cost=estimated_cost,
-            reason=reason,
+            # Own copies: callers may mutate models and the score mapping
+            reason_ctx=(routing_strategy, tuple(selected), dict(confidence_scores), threshold),
         )
     
     def get_routing_strategy(self, task_type: TaskType) -> RoutingStrategy:
@@ -299,15 +373,7 @@ class AdaptiveRouter:
         threshold: float,
     ) -> str:
         """Build explanation for routing decision."""
-        if not selected:
-            return "No models selected"
-        
-        scores_str = ", ".join(
-            f"{name}={model_scores.get(name, 0.5):.2f}"
-            for name in selected
-        )
-        
-        return f"Strategy: {strategy.value}, Models: {scores_str}, Threshold: {threshold:.2f}"
+        return _format_reason(strategy, selected, model_scores, threshold)
     
     def update_model_availability(self, model_name: str, enabled: bool) -> None:
         """Update model availability."""
@@ -320,6 +386,14 @@ class AdaptiveRouter:
         self.available_models[model.name] = model
         logger.info(f"Added model {model.name} to router")
     
+    def update_model_cost(self, model_name: str, cost_per_1m_tokens: float) -> None:
+        """Update a model's token cost (AIModel keeps cost_per_request in step)."""
+        model = self.available_models.get(model_name)
+        if model is None:
+            return
+        model.cost_per_1m_tokens = cost_per_1m_tokens
+        logger.info(f"Updated cost for {model_name}: {cost_per_1m_tokens}/1M tokens")
+    
     def remove_model(self, model_name: str) -> None:
         """Remove a model from the router."""
         if model_name in self.available_models:
@@ -8,17 +8,62 @@ Uses aiofiles for non-blocking file operations.
 import asyncio
 import json
 import os
-import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 import logging
 
-from .models import TaskType, PerformanceRecord, ConfidenceScore
+from .models import TaskType, PerformanceRecord, ConfidenceScore, TASK_TYPE_KEY_SUFFIXES, parse_isoformat
 from .config import OrchestratorConfig
+from .storage import _encode_records
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streaming reads of the performance history log
+_READ_CHUNK_SIZE = 1 << 20
+
+# Adaptive flush tuning
+_MIN_FLUSH_INTERVAL = 0.2  # seconds
+_MAX_BUFFER_SIZE_CEILING = 4096
+_FAST_FLUSH_SECONDS = 0.05
+_RATE_EMA_ALPHA = 0.3
+
+# Write buffer capacity as a multiple of the flush threshold; bounds memory
+# when flushes keep failing (oldest records are dropped first)
+_BUFFER_CAPACITY_FACTOR = 10
+
+
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+
+def _drop_appended(fd: int, offset: int, length: int) -> None:
+    """
+    Hint that a just-appended byte range will not be read back soon.
+    
+    Only that range is named, so pages readers have cached for older
+    records stay. The kernel starts writeback for the range and drops
+    whatever part of it is already clean.
+    """
+    if _HAS_FADVISE and length:
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+
+
+def _append_bytes_sync(path: str, content: bytes) -> None:
+    """Append bytes to a file, then apply _drop_appended to them."""
+    with open(path, 'ab') as f:
+        offset = f.tell()
+        f.write(content)
+        f.flush()
+        _drop_appended(f.fileno(), offset, len(content))
+
 
 class AsyncStorageManager:
     """
@@ -34,18 +79,26 @@ class AsyncStorageManager:
         self.performance_history_path = config.performance_history_path
 
         # In-memory cache
-        self._memory_scores: Dict[Tuple[str, TaskType], float] = {}
+        # Keyed by ConfidenceScore.storage_key ("<model>_<task_type>")
+        self._memory_scores: Dict[str, float] = {}
         self._memory_records: List[PerformanceRecord] = []
 
         # Write buffer for batching
-        self._write_buffer: List[PerformanceRecord] = []
         self._buffer_lock = asyncio.Lock()
-        self._flush_interval = 5.0  # seconds
+        self._flush_interval = 5.0  # seconds (upper bound, adapted to load)
         self._max_buffer_size = 100
+        self._write_buffer: Deque[PerformanceRecord] = self._new_write_buffer()
+
+        # Incoming record rate (records/sec EMA) used to adapt flush cadence
+        self._record_rate = 0.0
+        self._appended_since_tick = 0
 
         # Background flush task
         self._flush_task: Optional[asyncio.Task] = None
 
+        # Thread pool for JSON-encoding flush batches off the event loop
+        self._encode_pool: Optional[ThreadPoolExecutor] = None
+
         # Check if aiofiles is available
         self._use_aiofiles = False
         try:
@@ -54,6 +107,10 @@ class AsyncStorageManager:
         except ImportError:
             logger.warning("aiofiles not installed, using thread pool for async I/O")
 
+    def _new_write_buffer(self) -> Deque[PerformanceRecord]:
+        """Create an empty write buffer sized for the current flush threshold."""
+        return deque(maxlen=self._max_buffer_size * _BUFFER_CAPACITY_FACTOR)
+
     async def initialize(self) -> None:
         """Initialize storage files and start background tasks."""
         os.makedirs(self.config.storage_dir, exist_ok=True)
@@ -61,6 +118,11 @@ class AsyncStorageManager:
         # Initialize files
         await self._initialize_storage_files()
 
+        if self._encode_pool is None:
+            self._encode_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="storage-encode"
+            )
+
         # Start background flush task
         self._flush_task = asyncio.create_task(self._flush_loop())
         logger.info("AsyncStorageManager initialized")
@@ -77,6 +139,10 @@ class AsyncStorageManager:
 
         # Flush remaining buffer
         await self.flush_buffer()
+
+        if self._encode_pool is not None:
+            self._encode_pool.shutdown(wait=True)
+            self._encode_pool = None
         logger.info("AsyncStorageManager shutdown complete")
 
     async def _initialize_storage_files(self) -> None:
@@ -134,6 +200,50 @@ class AsyncStorageManager:
                 lambda: open(path, 'a', encoding='utf-8').write(content)
             )
 
+    async def _iter_history_lines(self, fd: int) -> AsyncIterator[bytearray]:
+        """
+        Yield raw lines from a JSONL file descriptor.
+
+        Reads in fixed-size chunks so memory stays bounded by the chunk size
+        rather than the file size.
+        """
+        loop = asyncio.get_event_loop()
+        residual = bytearray()
+
+        while True:
+            chunk = await loop.run_in_executor(None, os.read, fd, _READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            residual += chunk
+
+            start = 0
+            while True:
+                end = residual.find(b'\n', start)
+                if end < 0:
+                    break
+                yield residual[start:end]
+                start = end + 1
+            del residual[:start]
+
+        if residual:
+            yield residual
+
+    async def _append_bytes(self, path: str, content: bytes) -> None:
+        """Append raw bytes to file asynchronously."""
+        if self._use_aiofiles:
+            import aiofiles
+            async with aiofiles.open(path, 'ab') as f:
+                offset = await f.tell()
+                await f.write(content)
+                await f.flush()
+                if _HAS_FADVISE:
+                    await asyncio.get_event_loop().run_in_executor(
+                        None, _drop_appended, f.fileno(), offset, len(content)
+                    )
+        else:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, _append_bytes_sync, path, content)
+
     async def _read_json(self, path: str) -> Dict[str, Any]:
         """Read and parse JSON file asynchronously."""
         content = await self._read_file(path)
@@ -142,12 +252,15 @@ class AsyncStorageManager:
     async def _write_json(self, path: str, data: Any) -> None:
         """Write JSON data asynchronously with atomic write."""
         temp_path = f"{path}.tmp"
-        content = json.dumps(data, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            content = json.dumps(data, indent=2, ensure_ascii=False)
         await self._write_file(temp_path, content)
 
-        # Atomic rename (sync operation, but very fast)
+        # Atomic rename (single syscall, temp file lives in the same directory)
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: shutil.move(temp_path, path))
+        await loop.run_in_executor(None, os.replace, temp_path, path)
 
     async def save_confidence_scores(self, scores: List[ConfidenceScore]) -> bool:
         """
@@ -161,18 +274,18 @@ class AsyncStorageManager:
         """
         try:
             # Update memory cache
-            self._memory_scores = {
-                (s.model_name, s.task_type): s.score for s in scores
-            }
+            self._memory_scores = {s.storage_key: s.score for s in scores}
 
             # Serialize
             serializable_scores = {}
             for score in scores:
-                key = f"{score.model_name}_{score.task_type.value}"
-                serializable_scores[key] = {
+                serializable_scores[score.storage_key] = {
                     "score": score.score,
                     "sample_count": score.sample_count,
                     "last_updated": score.last_updated.isoformat(),
+                    "ewma_samples": score.ewma_samples,
+                    "ewma_weight_sum": score.ewma_weight_sum,
+                    "ewma_correct_sum": score.ewma_correct_sum,
                 }
 
             data = {
@@ -204,8 +317,7 @@ class AsyncStorageManager:
             scores = []
 
             for key, value in data.get("scores", {}).items():
-                for task_type in TaskType:
-                    suffix = f"_{task_type.value}"
+                for suffix, task_type in TASK_TYPE_KEY_SUFFIXES:
                     if key.endswith(suffix):
                         model_name = key[:-len(suffix)]
 
@@ -215,7 +327,10 @@ class AsyncStorageManager:
                                 task_type=task_type,
                                 score=value["score"],
                                 sample_count=value.get("sample_count", 0),
-                                last_updated=datetime.fromisoformat(value["last_updated"]) if "last_updated" in value else datetime.now(),
+                                last_updated=parse_isoformat(value["last_updated"]) if "last_updated" in value else datetime.now(),
+                                ewma_samples=value.get("ewma_samples", 0),
+                                ewma_weight_sum=value.get("ewma_weight_sum", 0.0),
+                                ewma_correct_sum=value.get("ewma_correct_sum", 0.0),
                             )
                         else:
                             score = ConfidenceScore(
@@ -227,9 +342,7 @@ class AsyncStorageManager:
                         break
 
             # Update memory cache
-            self._memory_scores = {
-                (s.model_name, s.task_type): s.score for s in scores
-            }
+            self._memory_scores = {s.storage_key: s.score for s in scores}
 
             logger.info(f"Async loaded {len(scores)} confidence scores")
             return scores
@@ -253,6 +366,7 @@ class AsyncStorageManager:
         async with self._buffer_lock:
             self._write_buffer.append(record)
             self._memory_records.append(record)
+            self._appended_since_tick += 1
 
             # Flush if buffer is full
             if len(self._write_buffer) >= self._max_buffer_size:
@@ -276,6 +390,7 @@ class AsyncStorageManager:
         async with self._buffer_lock:
             self._write_buffer.extend(records)
             self._memory_records.extend(records)
+            self._appended_since_tick += len(records)
 
             # Flush if buffer exceeds threshold
             if len(self._write_buffer) >= self._max_buffer_size:
@@ -298,33 +413,73 @@ class AsyncStorageManager:
         if not self._write_buffer:
             return 0
 
-        count = len(self._write_buffer)
+        # Swap in a fresh buffer so the flushed batch is detached
+        to_flush = self._write_buffer
+        self._write_buffer = self._new_write_buffer()
+        count = len(to_flush)
+        t0 = time.monotonic()
 
         try:
-            # Build content to append
-            lines = []
-            for record in self._write_buffer:
-                lines.append(json.dumps(record.to_dict(), ensure_ascii=False) + '\n')
-
-            content = ''.join(lines)
-            await self._append_file(self.performance_history_path, content)
+            # Encode off the event loop, then append
+            loop = asyncio.get_event_loop()
+            content = await loop.run_in_executor(
+                self._encode_pool, _encode_records, list(to_flush)
+            )
+            await self._append_bytes(self.performance_history_path, content)
 
             logger.debug(f"Flushed {count} records to disk")
 
         except Exception as e:
             logger.error(f"Failed to flush buffer: {e}")
-            # Don't clear buffer on failure, will retry
+            # Put records back in front of the buffer, will retry. At
+            # capacity, drop the oldest records (as append does), not the
+            # ones buffered during the failed flush
+            pending = list(to_flush)
+            pending.extend(self._write_buffer)
+            buffer = self._new_write_buffer()
+            overflow = len(pending) - buffer.maxlen
+            if overflow > 0:
+                logger.warning(
+                    f"Write buffer full after failed flush, dropping "
+                    f"{overflow} oldest performance records"
+                )
+                del pending[:overflow]
+            buffer.extend(pending)
+            self._write_buffer = buffer
             return 0
 
-        # Clear buffer on success
-        self._write_buffer.clear()
+        # Cheap full flushes mean the buffer can safely hold more records
+        if (
+            count >= self._max_buffer_size
+            and time.monotonic() - t0 < _FAST_FLUSH_SECONDS
+            and self._max_buffer_size < _MAX_BUFFER_SIZE_CEILING
+        ):
+            self._max_buffer_size = min(self._max_buffer_size * 2, _MAX_BUFFER_SIZE_CEILING)
+            logger.debug(f"Increased max buffer size to {self._max_buffer_size}")
+
         return count
 
+    def _next_flush_delay(self) -> float:
+        """Compute the sleep before the next flush from the recent record rate."""
+        return max(
+            _MIN_FLUSH_INTERVAL,
+            min(self._flush_interval, 100 / max(self._record_rate, 1.0))
+        )
+
     async def _flush_loop(self) -> None:
         """Background loop for periodic buffer flushing."""
         while True:
             try:
-                await asyncio.sleep(self._flush_interval)
+                delay = self._next_flush_delay()
+                await asyncio.sleep(delay)
+
+                # Update the record rate EMA from appends since the last tick
+                rate = self._appended_since_tick / delay
+                self._appended_since_tick = 0
+                self._record_rate = (
+                    _RATE_EMA_ALPHA * rate + (1 - _RATE_EMA_ALPHA) * self._record_rate
+                )
+
                 await self.flush_buffer()
             except asyncio.CancelledError:
                 break
@@ -335,7 +490,9 @@ class AsyncStorageManager:
         self,
         model_name: Optional[str] = None,
         task_type: Optional[TaskType] = None,
-        limit: int = 1000
+        limit: int = 1000,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
     ) -> List[PerformanceRecord]:
         """
         Query performance history asynchronously.
@@ -344,6 +501,8 @@ class AsyncStorageManager:
             model_name: Filter by model name
             task_type: Filter by task type
             limit: Maximum records to return
+            start_time: Filter records after this time
+            end_time: Filter records before this time
 
         Returns:
             List of matching records
@@ -353,29 +512,41 @@ class AsyncStorageManager:
                 return False
             if task_type and record.task_type != task_type:
                 return False
+            if start_time and record.timestamp < start_time:
+                return False
+            if end_time and record.timestamp > end_time:
+                return False
             return True
 
         if not os.path.exists(self.performance_history_path):
             return [r for r in self._memory_records if matches(r)][:limit]
 
         try:
-            content = await self._read_file(self.performance_history_path)
             records = []
+            fd = os.open(self.performance_history_path, os.O_RDONLY)
 
-            for line in content.splitlines():
-                if not line.strip():
-                    continue
-
-                try:
-                    data = json.loads(line)
-                    record = PerformanceRecord.from_dict(data)
-                    if matches(record):
-                        records.append(record)
-                        if len(records) >= limit:
-                            break
-                except Exception as e:
-                    logger.warning(f"Failed to parse record: {e}")
-                    continue
+            try:
+                if _HAS_FADVISE:
+                    # Sequential scan: ask the kernel for aggressive readahead
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                lines = self._iter_history_lines(fd)
+                async for line in lines:
+                    if not line.strip():
+                        continue
+
+                    try:
+                        record = PerformanceRecord.from_json(line)
+                        if matches(record):
+                            records.append(record)
+                            if len(records) >= limit:
+                                break
+                    except Exception as e:
+                        logger.warning(f"Failed to parse record: {e}")
+                        continue
+                await lines.aclose()
+            finally:
+                os.close(fd)
 
             return records
 
@@ -432,6 +603,8 @@ class AsyncStorageManager:
             "buffer_size": len(self._write_buffer),
             "max_buffer_size": self._max_buffer_size,
             "flush_interval": self._flush_interval,
+            "next_flush_delay": self._next_flush_delay(),
+            "record_rate": self._record_rate,
             "memory_records_count": len(self._memory_records),
             "memory_scores_count": len(self._memory_scores)
         }
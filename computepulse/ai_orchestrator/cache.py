@@ -6,41 +6,121 @@ Implements TTL-based cache with LRU eviction.
 """
 
 import hashlib
+import heapq
+import itertools
 import json
 import time
 import asyncio
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List
-from collections import OrderedDict
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Set, Tuple, Union
 from datetime import datetime
 import logging
 
+from .models import with_slots
+
+
 logger = logging.getLogger(__name__)
 
+# Fraction of max_size evicted in one batch when the cache is full
+_EVICTION_BATCH_FRACTION = 0.1
+
+# Value-aware eviction picks its victims from this many times as many of the
+# least recently used entries as it evicts
+_VALUE_EVICTION_WINDOW_FACTOR = 2
+
+# Max expired entries removed per lock acquisition during cleanup
+_CLEANUP_BATCH_SIZE = 500
+
+# Refresh interval of the cached clock while the cleanup task is running
+_CLOCK_TICK_SECONDS = 0.05
+
+# Prompts at least this long are hashed off the event loop by the async API
+_THREAD_HASH_MIN_CHARS = 1 << 16
+
+
+@lru_cache(maxsize=4096)
+def _hash_request(
+    prompt: str,
+    quality_threshold: Optional[float],
+    cost_limit: Optional[float],
+) -> str:
+    """Normalize and hash request parameters; memoized for repeated prompts."""
+    # Not a security boundary: BLAKE2b is faster than SHA-256 and a
+    # 16-byte digest gives the same 32 hex chars without truncation
+    if not quality_threshold and not cost_limit:
+        # Common case: prompt only; same key string as the general form
+        key_string = prompt.strip().lower() + "||"
+    else:
+        key_string = (
+            f"{prompt.strip().lower()}"
+            f"|{f'q{quality_threshold:.2f}' if quality_threshold else ''}"
+            f"|{f'c{cost_limit:.2f}' if cost_limit else ''}"
+        )
+    return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+
+
+async def _prehash_request(
+    prompt: str,
+    quality_threshold: Optional[float],
+    cost_limit: Optional[float],
+) -> None:
+    """
+    Warm the _hash_request memo for a long prompt in a worker thread.
+
+    The async cache API calls this first, so the synchronous lookup that
+    follows finds the key memoized instead of normalizing and hashing a
+    large prompt on the event loop.
+    """
+    if len(prompt) >= _THREAD_HASH_MIN_CHARS:
+        await asyncio.to_thread(_hash_request, prompt, quality_threshold, cost_limit)
+
 
-@dataclass
 class CacheEntry:
-    """Single cache entry with metadata."""
-    key: str
-    value: Any
-    created_at: float
-    expires_at: float
-    hit_count: int = 0
-    last_accessed: float = field(default_factory=time.time)
-    task_type: Optional[str] = None
-    models_used: List[str] = field(default_factory=list)
+    """
+    Single cache entry with metadata.
 
-    @property
-    def is_expired(self) -> bool:
-        """Check if entry has expired."""
-        return time.time() > self.expires_at
+    A plain ``__slots__`` class: caches hold many entries, and slots avoid a
+    per-instance ``__dict__``.
+    """
+    __slots__ = (
+        "key", "value", "created_at", "expires_at", "hit_count",
+        "last_accessed", "task_type", "models_used", "regeneration_cost",
+    )
 
-    @property
-    def age_seconds(self) -> float:
-        """Get age of entry in seconds."""
-        return time.time() - self.created_at
+    def __init__(
+        self,
+        key: str,
+        value: Any,
+        created_at: float,
+        expires_at: float,
+        hit_count: int = 0,
+        last_accessed: int = 0,  # Access ordinal, higher = more recently used
+        task_type: Optional[str] = None,
+        models_used: Optional[List[str]] = None
+    ):
+        self.key = key
+        self.value = value
+        self.created_at = created_at
+        self.expires_at = expires_at
+        self.hit_count = hit_count
+        self.last_accessed = last_accessed
+        self.task_type = task_type
+        self.models_used = models_used if models_used is not None else []
+        # Cost of recomputing the value; set by value-aware caches
+        self.regeneration_cost = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheEntry(key={self.key!r}, expires_at={self.expires_at!r}, "
+            f"hit_count={self.hit_count!r}, task_type={self.task_type!r})"
+        )
 
 
+@with_slots
 @dataclass
 class CacheStats:
     """Cache statistics."""
@@ -48,7 +128,6 @@ class CacheStats:
     misses: int = 0
     evictions: int = 0
     expired_removals: int = 0
-    total_entries: int = 0
     memory_usage_estimate: int = 0
 
     @property
@@ -58,6 +137,86 @@ class CacheStats:
         return (self.hits / total * 100) if total > 0 else 0.0
 
 
+class _CleanupScheduler:
+    """
+    Runs periodic cleanup for every registered cache from one coroutine.
+
+    Due times live in a min-heap of (next_run, token, weakref(cache)); the
+    coroutine sleeps until the earliest one instead of each cache keeping
+    its own sleeping task. Items whose token no longer matches the cache's
+    registration are skipped lazily.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, "weakref.ref[ResponseCache]"]] = []
+        self._tokens: "weakref.WeakKeyDictionary[ResponseCache, int]" = weakref.WeakKeyDictionary()
+        self._seq = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def is_registered(self, cache: "ResponseCache") -> bool:
+        return cache in self._tokens
+
+    def register(self, cache: "ResponseCache") -> None:
+        """Schedule periodic cleanup of ``cache``; must run on the event loop."""
+        token = next(self._seq)
+        self._tokens[cache] = token
+        heapq.heappush(
+            self._heap,
+            (time.monotonic() + cache.cleanup_interval, token, weakref.ref(cache)),
+        )
+
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        else:
+            # The new deadline may be earlier than the one being slept on
+            self._wakeup.set()
+
+    async def unregister(self, cache: "ResponseCache") -> None:
+        """Stop cleanup of ``cache``; the loop exits when none are left."""
+        self._tokens.pop(cache, None)
+        if not self._tokens and self._task is not None:
+            task, self._task = self._task, None
+            self._heap.clear()
+            if not task.done() and task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _run(self) -> None:
+        heap = self._heap
+        while heap:
+            next_run, token, ref = heap[0]
+            delay = next_run - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(heap)
+            cache = ref()
+            if cache is None or self._tokens.get(cache) != token:
+                continue
+
+            try:
+                cache.cleanup_expired()
+            except Exception as e:
+                logger.error(f"Cache cleanup error: {e}")
+            heapq.heappush(
+                heap, (time.monotonic() + cache.cleanup_interval, token, ref)
+            )
+
+
+_cleanup_scheduler = _CleanupScheduler()
+
+
 class ResponseCache:
     """
     LRU Cache with TTL for AI model responses.
@@ -68,6 +227,10 @@ class ResponseCache:
     - Prompt-based key generation
     - Cache statistics tracking
     - Thread-safe operations
+
+    Cache operations are O(1) in-memory work, so they are plain synchronous
+    methods guarded by a threading.Lock. Async callers can use ``aget`` /
+    ``aset``, which also hash very long prompts in a worker thread.
     """
 
     def __init__(
@@ -88,10 +251,55 @@ class ResponseCache:
         self.default_ttl = default_ttl_seconds
         self.cleanup_interval = cleanup_interval_seconds
 
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Plain dict: LRU order is tracked by access ordinals, not dict order
+        self._cache: Dict[str, CacheEntry] = {}
+        self._access_counter = itertools.count(1)
         self._stats = CacheStats()
-        self._lock = asyncio.Lock()
-        self._cleanup_task: Optional[asyncio.Task] = None
+
+        # Reverse indexes for O(matches) invalidation
+        self._by_task_type: Dict[str, Set[str]] = {}
+        self._by_model: Dict[str, Set[str]] = {}
+
+        # Min-heap of (expires_at, key); stale items are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+        # Monotonic clock cached once per tick while the event loop drives it;
+        # None means read time.monotonic() directly
+        self._clock: Optional[float] = None
+        self._clock_handle: Optional[asyncio.TimerHandle] = None
+        self._clock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # In-flight computations per key (single-flight for get_or_compute)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _now(self) -> float:
+        """Current monotonic time, from the tick cache when it is running."""
+        now = self._clock
+        if now is None:
+            return time.monotonic()
+        if not self._clock_loop.is_running():
+            # The loop stopped or closed without stop_cleanup_task(), so the
+            # tick no longer fires and the cached value would stay frozen
+            self._stop_clock()
+            return time.monotonic()
+        return now
+
+    def _tick(self) -> None:
+        """Refresh the cached clock and reschedule on the running loop."""
+        self._clock = time.monotonic()
+        self._clock_loop = asyncio.get_running_loop()
+        self._clock_handle = self._clock_loop.call_later(
+            _CLOCK_TICK_SECONDS, self._tick
+        )
+
+    def _stop_clock(self) -> None:
+        """Cancel the tick and go back to reading time.monotonic()."""
+        if self._clock_handle is not None:
+            self._clock_handle.cancel()
+        self._clock_handle = None
+        self._clock_loop = None
+        self._clock = None
 
     def _generate_key(
         self,
@@ -114,17 +322,11 @@ class ResponseCache:
             cost_limit: Optional cost limit
 
         Returns:
-            SHA256 hash as cache key
+            128-bit BLAKE2b hex digest as cache key
         """
-        key_parts = [
-            prompt.strip().lower(),
-            f"q{quality_threshold:.2f}" if quality_threshold else "",
-            f"c{cost_limit:.2f}" if cost_limit else ""
-        ]
-        key_string = "|".join(key_parts)
-        return hashlib.sha256(key_string.encode()).hexdigest()[:32]
+        return _hash_request(prompt, quality_threshold, cost_limit)
 
-    async def get(
+    def get(
         self,
         prompt: str,
         task_type: Optional[str] = None,
@@ -145,31 +347,35 @@ class ResponseCache:
         """
         key = self._generate_key(prompt, task_type, quality_threshold, cost_limit)
 
-        async with self._lock:
-            if key not in self._cache:
-                self._stats.misses += 1
-                return None
+        with self._lock:
+            return self._lookup(key)
 
-            entry = self._cache[key]
+    def _lookup(self, key: str, count_miss: bool = True) -> Optional[Any]:
+        """Look up a key and update hit statistics; caller holds the lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            if count_miss:
+                self._stats.misses += 1
+            return None
 
-            if entry.is_expired:
-                del self._cache[key]
+        if entry.expires_at < self._now():
+            self._remove_entry(key)
+            if count_miss:
                 self._stats.misses += 1
-                self._stats.expired_removals += 1
-                logger.debug(f"Cache entry expired: {key[:8]}...")
-                return None
+            self._stats.expired_removals += 1
+            logger.debug(f"Cache entry expired: {key[:8]}...")
+            return None
 
-            # Update access metadata (LRU)
-            entry.hit_count += 1
-            entry.last_accessed = time.time()
-            self._cache.move_to_end(key)
+        # Update access metadata (LRU); reads never reorder the dict
+        entry.hit_count += 1
+        entry.last_accessed = next(self._access_counter)
 
-            self._stats.hits += 1
-            logger.debug(f"Cache hit: {key[:8]}... (hits: {entry.hit_count})")
+        self._stats.hits += 1
+        logger.debug(f"Cache hit: {key[:8]}... (hits: {entry.hit_count})")
 
-            return entry.value
+        return entry.value
 
-    async def set(
+    def set(
         self,
         prompt: str,
         value: Any,
@@ -194,30 +400,185 @@ class ResponseCache:
         key = self._generate_key(prompt, task_type, quality_threshold, cost_limit)
         ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
 
-        async with self._lock:
-            # Evict if at capacity
-            while len(self._cache) >= self.max_size:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._stats.evictions += 1
-                logger.debug(f"Cache eviction (LRU): {oldest_key[:8]}...")
+        with self._lock:
+            # Replace an existing entry, or evict if at capacity
+            if (
+                self._remove_entry(key) is None
+                and len(self._cache) >= self.max_size
+            ):
+                self._evict_lru_batch()
 
-            now = time.time()
+            now = self._now()
             entry = CacheEntry(
                 key=key,
                 value=value,
                 created_at=now,
                 expires_at=now + ttl,
+                last_accessed=next(self._access_counter),
                 task_type=task_type,
                 models_used=models_used or []
             )
 
             self._cache[key] = entry
-            self._stats.total_entries = len(self._cache)
+            self._index_entry(entry)
+            self._push_expiry(entry)
 
             logger.debug(f"Cache set: {key[:8]}... (ttl: {ttl}s)")
 
-    async def invalidate(
+    def _index_entry(self, entry: CacheEntry) -> None:
+        """Add an entry to the reverse indexes (lock must be held)."""
+        if entry.task_type is not None:
+            self._by_task_type.setdefault(entry.task_type, set()).add(entry.key)
+        for model_name in entry.models_used:
+            self._by_model.setdefault(model_name, set()).add(entry.key)
+
+    @staticmethod
+    def _unindex(index: Dict[str, Set[str]], name: str, key: str) -> None:
+        keys = index.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[name]
+
+    def _remove_entry(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry and its index references (lock must be held)."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return None
+
+        if entry.task_type is not None:
+            self._unindex(self._by_task_type, entry.task_type, key)
+        for model_name in entry.models_used:
+            self._unindex(self._by_model, model_name, key)
+        return entry
+
+    def _push_expiry(self, entry: CacheEntry) -> None:
+        """Track an entry's expiry time (lock must be held)."""
+        heapq.heappush(self._expiry_heap, (entry.expires_at, entry.key))
+
+        # Removed/replaced entries leave stale items behind; rebuild from
+        # live entries once they dominate the heap
+        if len(self._expiry_heap) > 2 * max(self.max_size, len(self._cache)):
+            self._expiry_heap = [(e.expires_at, k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _evict_lru_batch(self) -> None:
+        """Evict least recently used entries in a single pass (lock must be held)."""
+        batch = max(1, int(self.max_size * _EVICTION_BATCH_FRACTION))
+        count = len(self._cache) - self.max_size + batch
+        victims = heapq.nsmallest(
+            count, self._cache.values(), key=attrgetter("last_accessed")
+        )
+        for entry in victims:
+            self._remove_entry(entry.key)
+
+        self._stats.evictions += len(victims)
+        logger.debug(f"Cache eviction (LRU): {len(victims)} entries")
+
+    async def aget(
+        self,
+        prompt: str,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None
+    ) -> Optional[Any]:
+        """Async :meth:`get`; long prompts are hashed in a worker thread."""
+        await _prehash_request(prompt, quality_threshold, cost_limit)
+        return self.get(prompt, task_type, quality_threshold, cost_limit)
+
+    async def aset(
+        self,
+        prompt: str,
+        value: Any,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        models_used: Optional[List[str]] = None
+    ) -> None:
+        """Async :meth:`set`; long prompts are hashed in a worker thread."""
+        await _prehash_request(prompt, quality_threshold, cost_limit)
+        self.set(prompt, value, task_type, quality_threshold, cost_limit, ttl_seconds, models_used)
+
+    async def get_or_compute(
+        self,
+        prompt: str,
+        compute: Callable[[], Awaitable[Any]],
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        models_used: Optional[List[str]] = None
+    ) -> Any:
+        """
+        Get a cached response, computing and caching it on a miss.
+
+        Concurrent misses for the same key share a single computation:
+        the first caller runs ``compute`` and later callers await its result.
+        If that caller is cancelled, the waiters retry and one of them takes
+        over the computation.
+
+        Args:
+            prompt: The request prompt
+            compute: Zero-argument coroutine factory producing the value
+            task_type: Optional task type
+            quality_threshold: Optional quality threshold
+            cost_limit: Optional cost limit
+            ttl_seconds: Custom TTL (uses default if not specified)
+            models_used: List of models that generated this response
+
+        Returns:
+            Cached or freshly computed value
+        """
+        cached = await self.aget(prompt, task_type, quality_threshold, cost_limit)
+        if cached is not None:
+            return cached
+
+        key = self._generate_key(prompt, task_type, quality_threshold, cost_limit)
+
+        while True:
+            with self._lock:
+                future = self._inflight.get(key)
+                if future is None:
+                    # A previous owner may have cached the value since the miss
+                    cached = self._lookup(key, count_miss=False)
+                    if cached is not None:
+                        return cached
+                    future = asyncio.get_running_loop().create_future()
+                    self._inflight[key] = future
+                    break
+
+            logger.debug(f"Cache single-flight wait: {key[:8]}...")
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The owner was cancelled, not this caller: retry
+                logger.debug(f"Cache single-flight owner cancelled: {key[:8]}...")
+
+        try:
+            value = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            self.set(
+                prompt, value, task_type, quality_threshold, cost_limit,
+                ttl_seconds, models_used
+            )
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            if not future.done():
+                # Cancelled or interrupted: waiters retry with a new owner
+                future.cancel()
+
+    def invalidate(
         self,
         prompt: str,
         task_type: Optional[str] = None,
@@ -238,15 +599,13 @@ class ResponseCache:
         """
         key = self._generate_key(prompt, task_type, quality_threshold, cost_limit)
 
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._stats.total_entries = len(self._cache)
+        with self._lock:
+            if self._remove_entry(key) is not None:
                 logger.debug(f"Cache invalidated: {key[:8]}...")
                 return True
             return False
 
-    async def invalidate_by_task_type(self, task_type: str) -> int:
+    def invalidate_by_task_type(self, task_type: str) -> int:
         """
         Invalidate all entries for a specific task type.
 
@@ -256,23 +615,22 @@ class ResponseCache:
         Returns:
             Number of entries removed
         """
-        async with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entry.task_type == task_type
-            ]
+        # Lock-free early reject: nothing indexed under this task type
+        if task_type not in self._by_task_type:
+            return 0
 
-            for key in keys_to_remove:
-                del self._cache[key]
+        with self._lock:
+            keys_to_remove = self._by_task_type.pop(task_type, set())
 
-            self._stats.total_entries = len(self._cache)
+            for key in keys_to_remove:
+                self._remove_entry(key)
 
             if keys_to_remove:
                 logger.info(f"Invalidated {len(keys_to_remove)} entries for task type: {task_type}")
 
             return len(keys_to_remove)
 
-    async def invalidate_by_model(self, model_name: str) -> int:
+    def invalidate_by_model(self, model_name: str) -> int:
         """
         Invalidate all entries that used a specific model.
 
@@ -284,60 +642,77 @@ class ResponseCache:
         Returns:
             Number of entries removed
         """
-        async with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if model_name in entry.models_used
-            ]
+        # Lock-free early reject: nothing indexed under this model
+        if model_name not in self._by_model:
+            return 0
 
-            for key in keys_to_remove:
-                del self._cache[key]
+        with self._lock:
+            keys_to_remove = self._by_model.pop(model_name, set())
 
-            self._stats.total_entries = len(self._cache)
+            for key in keys_to_remove:
+                self._remove_entry(key)
 
             if keys_to_remove:
                 logger.info(f"Invalidated {len(keys_to_remove)} entries for model: {model_name}")
 
             return len(keys_to_remove)
 
-    async def clear(self) -> int:
+    def clear(self) -> int:
         """
         Clear all cache entries.
 
         Returns:
             Number of entries cleared
         """
-        async with self._lock:
+        with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            self._stats.total_entries = 0
+            self._by_task_type.clear()
+            self._by_model.clear()
+            self._expiry_heap.clear()
             logger.info(f"Cache cleared: {count} entries removed")
             return count
 
-    async def cleanup_expired(self) -> int:
+    def cleanup_expired(self) -> int:
         """
         Remove all expired entries.
 
+        Pops due items from the expiry heap instead of scanning the cache,
+        releasing the lock every ``_CLEANUP_BATCH_SIZE`` items.
+
         Returns:
             Number of entries removed
         """
-        async with self._lock:
-            now = time.time()
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entry.expires_at < now
-            ]
+        now = self._now()
+        removed = 0
+        done = False
 
-            for key in keys_to_remove:
-                del self._cache[key]
-                self._stats.expired_removals += 1
+        while not done:
+            with self._lock:
+                heap = self._expiry_heap
+                processed = 0
+                while heap and heap[0][0] < now and processed < _CLEANUP_BATCH_SIZE:
+                    expires_at, key = heapq.heappop(heap)
+                    processed += 1
 
-            self._stats.total_entries = len(self._cache)
+                    # Skip stale items left by replaced or removed entries
+                    entry = self._cache.get(key)
+                    if entry is not None and entry.expires_at == expires_at:
+                        self._remove_entry(key)
+                        self._stats.expired_removals += 1
+                        removed += 1
 
-            if keys_to_remove:
-                logger.debug(f"Cleanup removed {len(keys_to_remove)} expired entries")
+                done = not heap or heap[0][0] >= now
 
-            return len(keys_to_remove)
+        if removed:
+            logger.debug(f"Cleanup removed {removed} expired entries")
+
+        return removed
+
+    @property
+    def total_entries(self) -> int:
+        """Current number of entries (len() is O(1), no lock needed)."""
+        return len(self._cache)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -352,37 +727,209 @@ class ResponseCache:
             "hit_rate": f"{self._stats.hit_rate:.2f}%",
             "evictions": self._stats.evictions,
             "expired_removals": self._stats.expired_removals,
-            "total_entries": self._stats.total_entries,
+            "total_entries": self.total_entries,
             "max_size": self.max_size,
             "default_ttl_seconds": self.default_ttl
         }
 
     async def start_cleanup_task(self) -> None:
-        """Start background cleanup task."""
-        if self._cleanup_task is None or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        """Register with the shared background cleanup scheduler."""
+        if self._clock_handle is None:
+            self._tick()
+        if not _cleanup_scheduler.is_registered(self):
+            _cleanup_scheduler.register(self)
             logger.info("Cache cleanup task started")
 
     async def stop_cleanup_task(self) -> None:
-        """Stop background cleanup task."""
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        """Unregister from the shared background cleanup scheduler."""
+        self._stop_clock()
+        if _cleanup_scheduler.is_registered(self):
+            await _cleanup_scheduler.unregister(self)
             logger.info("Cache cleanup task stopped")
 
-    async def _cleanup_loop(self) -> None:
-        """Background loop for periodic cleanup."""
-        while True:
-            try:
-                await asyncio.sleep(self.cleanup_interval)
-                await self.cleanup_expired()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Cache cleanup error: {e}")
+
+class ShardedResponseCache:
+    """
+    ResponseCache partitioned into independent shards.
+
+    Each request key maps to one shard by its hash, so operations on
+    different keys take different locks. Capacity and LRU eviction are
+    per shard; whole-cache operations fan out to every shard.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_size: int = 1000,
+        default_ttl_seconds: float = 3600.0,
+        cleanup_interval_seconds: float = 300.0
+    ):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            shards: Number of independent shards
+            max_size: Maximum number of entries across all shards
+            default_ttl_seconds: Default time-to-live for entries
+            cleanup_interval_seconds: Interval for automatic cleanup
+        """
+        shards = max(1, shards)
+        self.max_size = max_size
+        self.default_ttl = default_ttl_seconds
+        shard_size = max(1, -(-max_size // shards))
+        self._shards: List[ResponseCache] = [
+            ResponseCache(shard_size, default_ttl_seconds, cleanup_interval_seconds)
+            for _ in range(shards)
+        ]
+
+    def _shard(
+        self,
+        prompt: str,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None
+    ) -> ResponseCache:
+        """Shard owning a request; the key hash is memoized, so this is cheap."""
+        key = _hash_request(prompt, quality_threshold, cost_limit)
+        return self._shards[int(key[:8], 16) % len(self._shards)]
+
+    def get(
+        self,
+        prompt: str,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None
+    ) -> Optional[Any]:
+        """Get a cached response from the owning shard."""
+        return self._shard(prompt, quality_threshold, cost_limit).get(
+            prompt, task_type, quality_threshold, cost_limit
+        )
+
+    def set(
+        self,
+        prompt: str,
+        value: Any,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        models_used: Optional[List[str]] = None
+    ) -> None:
+        """Store a response in the owning shard."""
+        self._shard(prompt, quality_threshold, cost_limit).set(
+            prompt, value, task_type, quality_threshold, cost_limit,
+            ttl_seconds, models_used
+        )
+
+    async def aget(
+        self,
+        prompt: str,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None
+    ) -> Optional[Any]:
+        """Async :meth:`get`; long prompts are hashed in a worker thread."""
+        await _prehash_request(prompt, quality_threshold, cost_limit)
+        return self.get(prompt, task_type, quality_threshold, cost_limit)
+
+    async def aset(
+        self,
+        prompt: str,
+        value: Any,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        models_used: Optional[List[str]] = None
+    ) -> None:
+        """Async :meth:`set`; long prompts are hashed in a worker thread."""
+        await _prehash_request(prompt, quality_threshold, cost_limit)
+        self.set(prompt, value, task_type, quality_threshold, cost_limit, ttl_seconds, models_used)
+
+    async def get_or_compute(
+        self,
+        prompt: str,
+        compute: Callable[[], Awaitable[Any]],
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        models_used: Optional[List[str]] = None
+    ) -> Any:
+        """Single-flight get-or-compute on the owning shard."""
+        await _prehash_request(prompt, quality_threshold, cost_limit)
+        return await self._shard(prompt, quality_threshold, cost_limit).get_or_compute(
+            prompt, compute, task_type, quality_threshold, cost_limit,
+            ttl_seconds, models_used
+        )
+
+    def invalidate(
+        self,
+        prompt: str,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None
+    ) -> bool:
+        """Invalidate a specific cache entry in the owning shard."""
+        return self._shard(prompt, quality_threshold, cost_limit).invalidate(
+            prompt, task_type, quality_threshold, cost_limit
+        )
+
+    def invalidate_by_task_type(self, task_type: str) -> int:
+        """Invalidate all entries for a task type across every shard."""
+        return sum(shard.invalidate_by_task_type(task_type) for shard in self._shards)
+
+    def invalidate_by_model(self, model_name: str) -> int:
+        """Invalidate all entries produced by a model across every shard."""
+        return sum(shard.invalidate_by_model(model_name) for shard in self._shards)
+
+    def clear(self) -> int:
+        """Clear every shard, returning the number of entries removed."""
+        return sum(shard.clear() for shard in self._shards)
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from every shard."""
+        return sum(shard.cleanup_expired() for shard in self._shards)
+
+    @property
+    def total_entries(self) -> int:
+        """Current number of entries across all shards."""
+        return sum(shard.total_entries for shard in self._shards)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics aggregated over all shards.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        totals = CacheStats()
+        for shard in self._shards:
+            stats = shard._stats
+            totals.hits += stats.hits
+            totals.misses += stats.misses
+            totals.evictions += stats.evictions
+            totals.expired_removals += stats.expired_removals
+        return {
+            "hits": totals.hits,
+            "misses": totals.misses,
+            "hit_rate": f"{totals.hit_rate:.2f}%",
+            "evictions": totals.evictions,
+            "expired_removals": totals.expired_removals,
+            "total_entries": self.total_entries,
+            "max_size": self.max_size,
+            "default_ttl_seconds": self.default_ttl,
+            "shards": len(self._shards)
+        }
+
+    async def start_cleanup_task(self) -> None:
+        """Start the background cleanup task of every shard."""
+        for shard in self._shards:
+            await shard.start_cleanup_task()
+
+    async def stop_cleanup_task(self) -> None:
+        """Stop the background cleanup task of every shard."""
+        for shard in self._shards:
+            await shard.stop_cleanup_task()
 
 
 class SemanticCache(ResponseCache):
@@ -425,18 +972,98 @@ class SemanticCache(ResponseCache):
     # and computing similarities. This is a placeholder for future enhancement.
 
 
+class ValueAwareCache(ResponseCache):
+    """
+    ResponseCache whose eviction weighs entry value, not just recency (v-LRU).
+
+    When the cache is full, the least recently used entries form a candidate
+    window (``_VALUE_EVICTION_WINDOW_FACTOR`` times the eviction batch), and
+    the batch is taken from the candidates with the lowest hit count plus
+    regeneration cost. A burst of one-shot prompts then pushes out other
+    cheap, unused entries before results that were expensive to produce or
+    are reused.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl_seconds: float = 3600.0,
+        cleanup_interval_seconds: float = 300.0,
+        cost_of: Optional[Callable[[List[str]], float]] = None
+    ):
+        """
+        Initialize value-aware cache.
+
+        Args:
+            max_size: Maximum number of entries
+            default_ttl_seconds: Default time-to-live for entries
+            cleanup_interval_seconds: Interval for automatic cleanup
+            cost_of: Regeneration cost of a value from the models that
+                produced it (e.g. summed cost per 1M tokens); entries cost
+                nothing if omitted
+        """
+        super().__init__(max_size, default_ttl_seconds, cleanup_interval_seconds)
+        self._cost_of = cost_of
+
+    def set(
+        self,
+        prompt: str,
+        value: Any,
+        task_type: Optional[str] = None,
+        quality_threshold: Optional[float] = None,
+        cost_limit: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        models_used: Optional[List[str]] = None
+    ) -> None:
+        """Cache a response, recording what it would cost to regenerate."""
+        super().set(
+            prompt, value, task_type, quality_threshold, cost_limit,
+            ttl_seconds, models_used
+        )
+        if self._cost_of is None or not models_used:
+            return
+        cost = self._cost_of(models_used)
+        key = self._generate_key(prompt, task_type, quality_threshold, cost_limit)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                entry.regeneration_cost = cost
+
+    def _evict_lru_batch(self) -> None:
+        """Evict low-value entries among the least recently used (lock must be held)."""
+        batch = max(1, int(self.max_size * _EVICTION_BATCH_FRACTION))
+        count = len(self._cache) - self.max_size + batch
+        window = heapq.nsmallest(
+            count * _VALUE_EVICTION_WINDOW_FACTOR,
+            self._cache.values(),
+            key=attrgetter("last_accessed"),
+        )
+        # Ranking by hits + cost orders entries like log(hits + cost + eps);
+        # recency breaks ties
+        victims = heapq.nsmallest(
+            count,
+            window,
+            key=lambda e: (e.hit_count + e.regeneration_cost, e.last_accessed),
+        )
+        for entry in victims:
+            self._remove_entry(entry.key)
+
+        self._stats.evictions += len(victims)
+        logger.debug(f"Cache eviction (v-LRU): {len(victims)} entries")
+
+
 # Convenience function for creating configured cache
 def create_cache(
     cache_type: str = "lru",
     max_size: int = 1000,
     ttl_seconds: float = 3600.0,
     **kwargs
-) -> ResponseCache:
+) -> Union[ResponseCache, ShardedResponseCache]:
     """
     Factory function to create cache instances.
 
     Args:
-        cache_type: Type of cache ("lru" or "semantic")
+        cache_type: Type of cache ("lru", "vlru", "sharded" or "semantic")
         max_size: Maximum cache size
         ttl_seconds: Default TTL
         **kwargs: Additional cache-specific arguments
@@ -444,7 +1071,21 @@ def create_cache(
     Returns:
         Configured cache instance
     """
-    if cache_type == "semantic":
+    if cache_type == "sharded":
+        return ShardedResponseCache(
+            shards=kwargs.get("shards", 16),
+            max_size=max_size,
+            default_ttl_seconds=ttl_seconds,
+            cleanup_interval_seconds=kwargs.get("cleanup_interval", 300.0)
+        )
+    elif cache_type == "vlru":
+        return ValueAwareCache(
+            max_size=max_size,
+            default_ttl_seconds=ttl_seconds,
+            cleanup_interval_seconds=kwargs.get("cleanup_interval", 300.0),
+            cost_of=kwargs.get("cost_of")
+        )
+    elif cache_type == "semantic":
         return SemanticCache(
             max_size=max_size,
             default_ttl_seconds=ttl_seconds,
@@ -28,6 +28,8 @@ class OrchestratorConfig:
     # Parallel execution
     model_timeout_seconds: float = 30.0
     enable_early_result_processing: bool = True
+    event_loop: str = "asyncio"  # For install_event_loop_policy(); "uvloop" when installed
+    eager_tasks: bool = True  # Start model calls eagerly (Python 3.12+)
     
     # Storage paths
     storage_dir: str = field(default_factory=lambda: os.path.join(
@@ -39,6 +41,10 @@ class OrchestratorConfig:
     confidence_scores_file: str = "confidence_scores.json"
     performance_history_file: str = "performance_history.jsonl"
     
+    # Request IDs: per-process counter IDs by default; UUID4 when they must be
+    # globally unique
+    use_uuid_request_ids: bool = False
+    
     # Performance tracking
     enable_performance_tracking: bool = True
     enable_anomaly_detection: bool = True
@@ -84,7 +90,10 @@ class OrchestratorConfig:
             "validation_model_count": self.validation_model_count,
             "model_timeout_seconds": self.model_timeout_seconds,
             "enable_early_result_processing": self.enable_early_result_processing,
+            "event_loop": self.event_loop,
+            "eager_tasks": self.eager_tasks,
             "storage_dir": self.storage_dir,
+            "use_uuid_request_ids": self.use_uuid_request_ids,
             "enable_performance_tracking": self.enable_performance_tracking,
             "enable_anomaly_detection": self.enable_anomaly_detection,
             "enable_feedback_loop": self.enable_feedback_loop,
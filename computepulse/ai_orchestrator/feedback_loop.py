@@ -5,18 +5,93 @@ This module captures validation results and user corrections,
 feeding them back to the learning engine for continuous improvement.
 """
 
+import hashlib
+import json
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from .models import TaskType, ValidationResult
-from .learning_engine import LearningEngine
+from .learning_engine import BatchEntry, LearningEngine
 
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Characters of serialized data kept as a human-readable preview
+_PREVIEW_CHARS = 200
+
+
+def _tail(
+    items: Deque[_T],
+    limit: int,
+    predicate: Optional[Callable[[_T], bool]] = None,
+) -> List[_T]:
+    """Return the last ``limit`` items (oldest first), walking from the right."""
+    newest: Iterable[_T] = reversed(items)
+    if predicate is not None:
+        newest = filter(predicate, newest)
+    result = list(islice(newest, limit))
+    result.reverse()
+    return result
+
+
+def _compare_str(output: str, ground_truth: str) -> bool:
+    # Case-insensitive, whitespace-normalized
+    return ground_truth.strip().lower() == output.strip().lower()
+
+
+def _compare_num(output: float, ground_truth: float) -> bool:
+    tolerance = abs(ground_truth) * 0.01  # 1% tolerance
+    return abs(ground_truth - output) <= tolerance
+
+
+# Numeric types compared with tolerance; bool is an int subclass, so mixed
+# numeric values (and subclasses such as IntEnum) still match
+_NUMBER_TYPES = (int, float)
+
+
+def _compare_outputs(output: Any, ground_truth: Any) -> bool:
+    """
+    Tolerant structural comparison of a model output with ground truth.
+    
+    Walks nested lists and dicts with an explicit stack, so deep structures
+    cost no Python frames and cannot hit the recursion limit. Values are
+    classified with isinstance, so subclasses of str, list and dict compare
+    like their base types; anything else falls back to exact equality.
+    """
+    stack = [(output, ground_truth)]
+    while stack:
+        out, truth = stack.pop()
+        if out is None:
+            return False
+        if out is truth:
+            continue
+        
+        if isinstance(truth, _NUMBER_TYPES) and isinstance(out, _NUMBER_TYPES):
+            if not _compare_num(out, truth):
+                return False
+        elif isinstance(truth, str) and isinstance(out, str):
+            if not _compare_str(out, truth):
+                return False
+        elif isinstance(truth, list) and isinstance(out, list):
+            if len(out) != len(truth):
+                return False
+            stack.extend(zip(out, truth))
+        elif isinstance(truth, dict) and isinstance(out, dict):
+            if out.keys() != truth.keys():
+                return False
+            stack.extend((out[k], v) for k, v in truth.items())
+        elif out != truth:
+            return False
+    
+    return True
+
 
 class CorrectionType(Enum):
     """Types of user corrections."""
@@ -51,13 +126,37 @@ class ValidationFeedback:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class DataFingerprint:
+    """Content hash, size and short preview standing in for a data payload."""
+    data_hash: str
+    data_size: int
+    data_preview: str
+    
+    @classmethod
+    def of(cls, data: Any) -> "DataFingerprint":
+        """Fingerprint arbitrary JSON-like data without keeping a reference to it."""
+        serialized = json.dumps(data, default=str, sort_keys=True, ensure_ascii=False)
+        encoded = serialized.encode()
+        return cls(
+            data_hash=hashlib.blake2b(encoded, digest_size=16).hexdigest(),
+            data_size=len(encoded),
+            data_preview=serialized[:_PREVIEW_CHARS],
+        )
+
+
 @dataclass
 class UserCorrection:
-    """Record of a user correction."""
+    """
+    Record of a user correction.
+    
+    Payloads are kept as fingerprints so the bounded correction history
+    does not pin large model outputs in memory.
+    """
     request_id: str
     correction_type: CorrectionType
-    original_data: Any
-    corrected_data: Any
+    original: DataFingerprint
+    corrected: DataFingerprint
     timestamp: datetime
     affected_models: List[str]
     notes: Optional[str] = None
@@ -86,13 +185,34 @@ class FeedbackLoop:
             negative_weight: Weight for negative feedback
         """
         self.learning_engine = learning_engine
-        self.positive_weight = positive_weight
-        self.negative_weight = negative_weight
+        # Feedback weights indexed by was_correct: (negative, positive)
+        self._weights: Tuple[float, float] = (negative_weight, positive_weight)
         
         # In-memory feedback history (recent only)
-        self._recent_feedbacks: List[ValidationFeedback] = []
-        self._recent_corrections: List[UserCorrection] = []
         self._max_history = 1000
+        self._recent_feedbacks: Deque[ValidationFeedback] = deque(maxlen=self._max_history)
+        self._recent_corrections: Deque[UserCorrection] = deque(maxlen=self._max_history)
+        
+        # Running [correct, total] per model over _recent_feedbacks
+        self._accuracy: Dict[str, List[int]] = {}
+    
+    @property
+    def positive_weight(self) -> float:
+        """Weight for positive feedback."""
+        return self._weights[True]
+    
+    @positive_weight.setter
+    def positive_weight(self, value: float) -> None:
+        self._weights = (self._weights[False], value)
+    
+    @property
+    def negative_weight(self) -> float:
+        """Weight for negative feedback."""
+        return self._weights[False]
+    
+    @negative_weight.setter
+    def negative_weight(self, value: float) -> None:
+        self._weights = (value, self._weights[True])
     
     def record_validation(
         self,
@@ -116,6 +236,8 @@ class FeedbackLoop:
             ValidationFeedback record
         """
         model_feedbacks = []
+        batch: List[BatchEntry] = []
+        weights = self._weights
         
         for model_name, response_data in model_responses.items():
             # Determine if model was correct
@@ -137,25 +259,19 @@ class FeedbackLoop:
             )
             model_feedbacks.append(feedback)
             
-            # Record performance in learning engine
-            self.learning_engine.record_performance(
-                model_name=model_name,
-                task_type=task_type,
-                was_correct=was_correct,
-                response_time=feedback.response_time,
-                cost=feedback.cost,
-                token_count=feedback.token_count,
-                request_id=request_id,
-            )
-            
-            # Apply immediate feedback
-            weight = self.positive_weight if was_correct else self.negative_weight
-            self.learning_engine.apply_feedback(
-                model_name=model_name,
-                task_type=task_type,
-                was_correct=was_correct,
-                weight=weight,
-            )
+            batch.append((
+                model_name,
+                task_type,
+                was_correct,
+                feedback.response_time,
+                feedback.cost,
+                feedback.token_count,
+                request_id,
+                weights[was_correct],
+            ))
+        
+        # Record performance and apply immediate feedback in one pass
+        self.learning_engine.record_batch(batch)
         
         # Create feedback record
         feedback_record = ValidationFeedback(
@@ -205,30 +321,26 @@ class FeedbackLoop:
         correction = UserCorrection(
             request_id=request_id,
             correction_type=correction_type,
-            original_data=original_data,
-            corrected_data=corrected_data,
+            original=DataFingerprint.of(original_data),
+            corrected=DataFingerprint.of(corrected_data),
             timestamp=datetime.now(),
             affected_models=affected_models,
             notes=notes,
         )
         
         # Apply negative feedback to affected models
+        penalty = self.negative_weight * 1.5  # Extra penalty for user corrections
+        self.learning_engine.apply_feedback_batch([
+            (model_name, task_type, False, penalty)
+            for model_name in affected_models
+        ])
         for model_name in affected_models:
-            self.learning_engine.apply_feedback(
-                model_name=model_name,
-                task_type=task_type,
-                was_correct=False,
-                weight=self.negative_weight * 1.5,  # Extra penalty for user corrections
-            )
-            
             logger.info(
                 f"Applied correction penalty to {model_name} for {task_type.value}"
             )
         
         # Store correction
         self._recent_corrections.append(correction)
-        if len(self._recent_corrections) > self._max_history:
-            self._recent_corrections.pop(0)
         
         logger.info(
             f"Recorded user correction for request {request_id[:8]}... "
@@ -264,7 +376,7 @@ class FeedbackLoop:
             token_count=0,
         )
         
-        weight = self.positive_weight if was_correct else self.negative_weight
+        weight = self._weights[was_correct]
         self.learning_engine.apply_feedback(
             model_name=model_name,
             task_type=task_type,
@@ -317,44 +429,29 @@ class FeedbackLoop:
         Returns:
             True if outputs match
         """
-        if output is None:
-            return False
-        
-        # String comparison (case-insensitive, whitespace-normalized)
-        if isinstance(ground_truth, str) and isinstance(output, str):
-            return ground_truth.strip().lower() == output.strip().lower()
-        
-        # Numeric comparison (with tolerance)
-        if isinstance(ground_truth, (int, float)) and isinstance(output, (int, float)):
-            tolerance = abs(ground_truth) * 0.01  # 1% tolerance
-            return abs(ground_truth - output) <= tolerance
-        
-        # List comparison
-        if isinstance(ground_truth, list) and isinstance(output, list):
-            if len(ground_truth) != len(output):
-                return False
-            return all(
-                self._compare_outputs(a, b) 
-                for a, b in zip(ground_truth, output)
-            )
-        
-        # Dict comparison
-        if isinstance(ground_truth, dict) and isinstance(output, dict):
-            if set(ground_truth.keys()) != set(output.keys()):
-                return False
-            return all(
-                self._compare_outputs(ground_truth[k], output[k])
-                for k in ground_truth.keys()
-            )
-        
-        # Default: exact match
-        return ground_truth == output
+        return _compare_outputs(output, ground_truth)
     
     def _add_to_history(self, feedback: ValidationFeedback) -> None:
-        """Add feedback to history, maintaining max size."""
-        self._recent_feedbacks.append(feedback)
-        if len(self._recent_feedbacks) > self._max_history:
-            self._recent_feedbacks.pop(0)
+        """Add feedback to history, keeping the accuracy counters in step."""
+        history = self._recent_feedbacks
+        accuracy = self._accuracy
+        
+        # The deque drops the oldest entry when full; retire its counts first
+        if len(history) == history.maxlen:
+            for model_feedback in history[0].model_feedbacks:
+                row = accuracy[model_feedback.model_name]
+                row[0] -= model_feedback.was_correct
+                row[1] -= 1
+                if not row[1]:
+                    del accuracy[model_feedback.model_name]
+        
+        history.append(feedback)
+        for model_feedback in feedback.model_feedbacks:
+            row = accuracy.get(model_feedback.model_name)
+            if row is None:
+                row = accuracy[model_feedback.model_name] = [0, 0]
+            row[0] += model_feedback.was_correct
+            row[1] += 1
     
     def get_recent_feedbacks(
         self,
@@ -371,12 +468,8 @@ class FeedbackLoop:
         Returns:
             List of recent feedbacks
         """
-        feedbacks = self._recent_feedbacks
-        
-        if task_type:
-            feedbacks = [f for f in feedbacks if f.task_type == task_type]
-        
-        return feedbacks[-limit:]
+        predicate = (lambda f: f.task_type == task_type) if task_type else None
+        return _tail(self._recent_feedbacks, limit, predicate)
     
     def get_recent_corrections(
         self,
@@ -393,12 +486,11 @@ class FeedbackLoop:
         Returns:
             List of recent corrections
         """
-        corrections = self._recent_corrections
-        
-        if correction_type:
-            corrections = [c for c in corrections if c.correction_type == correction_type]
-        
-        return corrections[-limit:]
+        predicate = (
+            (lambda c: c.correction_type == correction_type)
+            if correction_type else None
+        )
+        return _tail(self._recent_corrections, limit, predicate)
     
     def get_model_accuracy_summary(
         self,
@@ -413,28 +505,15 @@ class FeedbackLoop:
         Returns:
             Dict of model_name -> {correct, total, accuracy}
         """
-        summary: Dict[str, Dict[str, float]] = {}
-        
-        for feedback in self._recent_feedbacks:
-            for model_feedback in feedback.model_feedbacks:
-                if model_name and model_feedback.model_name != model_name:
-                    continue
-                
-                name = model_feedback.model_name
-                if name not in summary:
-                    summary[name] = {"correct": 0, "total": 0, "accuracy": 0.0}
-                
-                summary[name]["total"] += 1
-                if model_feedback.was_correct:
-                    summary[name]["correct"] += 1
-        
-        # Calculate accuracy
-        for name in summary:
-            total = summary[name]["total"]
-            if total > 0:
-                summary[name]["accuracy"] = summary[name]["correct"] / total
-        
-        return summary
+        return {
+            name: {
+                "correct": correct,
+                "total": total,
+                "accuracy": correct / total,
+            }
+            for name, (correct, total) in self._accuracy.items()
+            if not model_name or name == model_name
+        }
     
     def trigger_confidence_update(self) -> None:
         """Trigger a full confidence score update in the learning engine."""
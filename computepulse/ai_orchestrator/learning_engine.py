@@ -5,23 +5,50 @@ This module implements the learning engine that tracks AI model performance,
 calculates confidence scores using EWMA, and provides performance analysis.
 """
 
+import atexit
 import logging
+import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Dict, List, Optional, Set, Tuple
 
 from .models import (
     TaskType,
     PerformanceRecord,
     ConfidenceScore,
     MetricsSummary,
+    with_slots,
 )
 from .storage import StorageManager
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 logger = logging.getLogger(__name__)
 
+_was_correct = attrgetter("was_correct")
+_response_time = attrgetter("response_time")
+_cost = attrgetter("cost")
+
+
+def _flush_at_exit(engine_ref: "weakref.ref[LearningEngine]") -> None:
+    """atexit hook: write scores a still-live engine has not saved yet."""
+    engine = engine_ref()
+    if engine is not None:
+        engine.flush()
+
+
+# (model_name, task_type, was_correct, response_time, cost, token_count,
+#  request_id, weight) as accepted by LearningEngine.record_batch
+BatchEntry = Tuple[str, TaskType, bool, float, float, int, Optional[str], float]
 
+
+@with_slots
 @dataclass
 class PerformanceReport:
     """Performance report for AI models."""
@@ -69,6 +96,13 @@ class LearningEngine:
     # Minimum samples for full confidence
     MIN_SAMPLES_FOR_FULL_CONFIDENCE = 100
     
+    # Persist changed scores at most this often (the first change after a
+    # quiet period is saved at once; flush() or process exit writes the rest)...
+    SAVE_INTERVAL_SECONDS = 5.0
+    
+    # ...unless this many scores are waiting to be written
+    SAVE_BATCH_SIZE = 50
+    
     def __init__(
         self,
         storage: StorageManager,
@@ -87,31 +121,84 @@ class LearningEngine:
         self.decay_factor = decay_factor
         self.smoothing_factor = smoothing_factor
         
-        # In-memory confidence scores cache
+        # In-memory confidence scores cache. Writers may run on another
+        # thread (the orchestrator's feedback worker), so readers that
+        # iterate it take a list() snapshot: one C-level copy that a new
+        # key cannot interrupt
         self._confidence_scores: Dict[Tuple[str, TaskType], ConfidenceScore] = {}
         
+        # Plain score floats indexed by task type, then model name, so the
+        # ranking lookups scan floats rather than score objects
+        self._task_scores: Dict[TaskType, Dict[str, float]] = {}
+        
+        # Keys changed since the last save
+        self._dirty_keys: Set[Tuple[str, TaskType]] = set()
+        
+        # Bumped on every score change so callers can cache derived rankings
+        self.score_version = 0
+        
         # Load existing scores from storage
         self._load_confidence_scores()
+        self._dirty_keys.clear()
+        # No save yet: the first change is written immediately, later ones
+        # within SAVE_INTERVAL_SECONDS are batched
+        self._last_save = float("-inf")
+        
+        # Scores changed since the last batched save are written at exit
+        # (weakly referenced, so the hook doesn't keep the engine alive)
+        atexit.register(_flush_at_exit, weakref.ref(self))
+        
+        # Running EWMA state is rebuilt from history once if not persisted
+        self._ewma_seeded = any(
+            s.ewma_samples for s in self._confidence_scores.values()
+        )
     
     def _load_confidence_scores(self) -> None:
         """Load confidence scores from storage."""
         try:
             scores = self.storage.load_confidence_scores()
             for score in scores:
-                key = (score.model_name, score.task_type)
-                self._confidence_scores[key] = score
+                self._store_score(score)
             logger.info(f"Loaded {len(scores)} confidence scores from storage")
         except Exception as e:
             logger.warning(f"Failed to load confidence scores: {e}")
     
+    def _store_score(self, score: ConfidenceScore) -> ConfidenceScore:
+        """Insert or replace a score, keeping the per-task index in step."""
+        key = (score.model_name, score.task_type)
+        self._confidence_scores[key] = score
+        self._dirty_keys.add(key)
+        by_model = self._task_scores.get(score.task_type)
+        if by_model is None:
+            by_model = self._task_scores[score.task_type] = {}
+        by_model[score.model_name] = score.score
+        self.score_version += 1
+        return score
+    
     def _save_confidence_scores(self) -> None:
-        """Save confidence scores to storage."""
+        """Save changed confidence scores to storage."""
+        self._last_save = time.monotonic()
+        if not self._dirty_keys:
+            return
         try:
-            scores = list(self._confidence_scores.values())
-            self.storage.save_confidence_scores(scores)
+            scores = [self._confidence_scores[key] for key in self._dirty_keys]
+            if self.storage.upsert_confidence_scores(scores):
+                self._dirty_keys.clear()
         except Exception as e:
             logger.error(f"Failed to save confidence scores: {e}")
     
+    def _maybe_save(self) -> None:
+        """Save if enough scores changed or the save interval has elapsed."""
+        if (
+            len(self._dirty_keys) >= self.SAVE_BATCH_SIZE
+            or time.monotonic() - self._last_save >= self.SAVE_INTERVAL_SECONDS
+        ):
+            self._save_confidence_scores()
+    
+    def flush(self) -> None:
+        """Persist any confidence scores not yet written to storage."""
+        self._save_confidence_scores()
+    
     def record_performance(
         self,
         model_name: str,
@@ -145,8 +232,11 @@ class LearningEngine:
             request_id=request_id,
         )
         
+        self._ensure_ewma_seeded()
+        
         # Append to storage
         self.storage.append_performance_record(record)
+        self._update_ewma(model_name, task_type, was_correct)
         
         logger.debug(
             f"Recorded performance: {model_name} on {task_type.value} - "
@@ -154,66 +244,105 @@ class LearningEngine:
         )
     
     def update_confidence_scores(self) -> None:
-        """Recalculate confidence scores based on accumulated data."""
-        # Get all unique model-task combinations from history
-        history = self.storage.query_performance_history(limit=10000)
-        
-        # Group by model and task type
-        grouped: Dict[Tuple[str, TaskType], List[PerformanceRecord]] = {}
-        for record in history:
-            key = (record.model_name, record.task_type)
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(record)
-        
-        # Update scores for each combination
-        for (model_name, task_type), records in grouped.items():
-            new_score = self._calculate_confidence_score(records)
-            self._update_score(model_name, task_type, new_score, len(records))
-        
-        # Save updated scores
-        self._save_confidence_scores()
-        
-        logger.info(f"Updated {len(grouped)} confidence scores")
-    
-    def _calculate_confidence_score(
-        self, 
-        performance_history: List[PerformanceRecord]
-    ) -> float:
         """
-        Calculate confidence score using EWMA.
+        Recalculate confidence scores from the running EWMA state.
         
-        Args:
-            performance_history: List of performance records
-            
-        Returns:
-            Confidence score between 0 and 1
+        The state is updated online as records arrive, so this is O(groups)
+        rather than a rescan of the performance history.
         """
-        if not performance_history:
-            return self.DEFAULT_CONFIDENCE
-        
-        # Sort by timestamp (most recent first)
-        sorted_history = sorted(
-            performance_history, 
-            key=lambda r: r.timestamp, 
-            reverse=True
+        self._ensure_ewma_seeded()
+        
+        updated = 0
+        now = datetime.now()
+        for (model_name, task_type), score_obj in list(self._confidence_scores.items()):
+            count = score_obj.ewma_samples
+            if not count:
+                continue
+            accuracy = score_obj.ewma_correct_sum / score_obj.ewma_weight_sum
+            new_score = self._blend_confidence(accuracy, count)
+            self._update_score(model_name, task_type, new_score, count, now)
+            updated += 1
+        
+        # Save updated scores (debounced; see flush())
+        self._maybe_save()
+        
+        logger.info(f"Updated {updated} confidence scores")
+    
+    def _update_ewma(
+        self,
+        model_name: str,
+        task_type: TaskType,
+        was_correct: bool,
+    ) -> None:
+        """Fold one outcome into the running EWMA state for a model-task pair."""
+        key = (model_name, task_type)
+        score_obj = self._confidence_scores.get(key)
+        if score_obj is None:
+            score_obj = self._store_score(ConfidenceScore(
+                model_name=model_name,
+                task_type=task_type,
+                score=self.DEFAULT_CONFIDENCE,
+            ))
+        
+        self._dirty_keys.add(key)
+        decay = self.decay_factor
+        score_obj.ewma_samples += 1
+        score_obj.ewma_weight_sum = 1.0 + decay * score_obj.ewma_weight_sum
+        score_obj.ewma_correct_sum = (
+            (1.0 if was_correct else 0.0) + decay * score_obj.ewma_correct_sum
         )
+    
+    def _ensure_ewma_seeded(self) -> None:
+        """Rebuild the running EWMA state from stored history, once."""
+        if self._ewma_seeded:
+            return
+        self._ewma_seeded = True
         
-        # Calculate weighted accuracy using EWMA
-        total_weight = 0.0
-        weighted_correct = 0.0
+        history = self.storage.query_performance_history(
+            limit=10000, sort="timestamp_desc"
+        )
         
-        for i, record in enumerate(sorted_history):
-            weight = self.decay_factor ** i
-            total_weight += weight
-            
+        # One pass over newest-first history: accumulate each group's EWMA
+        # as [sample_count, next_weight, weighted_correct] without building
+        # per-group record lists
+        decay = self.decay_factor
+        grouped: Dict[Tuple[str, TaskType], List[float]] = {}
+        for record in history:
+            key = (record.model_name, record.task_type)
+            state = grouped.get(key)
+            if state is None:
+                state = grouped[key] = [0, 1.0, 0.0]
             if record.was_correct:
-                weighted_correct += weight
-        
-        accuracy = weighted_correct / total_weight if total_weight > 0 else 0.5
-        
+                state[2] += state[1]
+            state[1] *= decay
+            state[0] += 1
+        
+        for (model_name, task_type), (count, _, weighted_correct) in grouped.items():
+            key = (model_name, task_type)
+            score_obj = self._confidence_scores.get(key)
+            if score_obj is None:
+                score_obj = self._store_score(ConfidenceScore(
+                    model_name=model_name,
+                    task_type=task_type,
+                    score=self.DEFAULT_CONFIDENCE,
+                ))
+            self._dirty_keys.add(key)
+            score_obj.ewma_samples = count
+            score_obj.ewma_weight_sum = self._ewma_total_weight(count)
+            score_obj.ewma_correct_sum = weighted_correct
+        
+        logger.debug(f"Seeded EWMA state for {len(grouped)} model-task pairs")
+    
+    def _ewma_total_weight(self, n: int) -> float:
+        """Sum of decay_factor ** i for i in range(n), in closed form."""
+        decay = self.decay_factor
+        if decay == 1.0:
+            return float(n)
+        return (1.0 - decay ** n) / (1.0 - decay)
+    
+    def _blend_confidence(self, accuracy: float, sample_size: int) -> float:
+        """Blend accuracy with the default score based on sample size."""
         # Adjust for sample size
-        sample_size = len(performance_history)
         confidence_adjustment = min(
             1.0, 
             sample_size / self.MIN_SAMPLES_FOR_FULL_CONFIDENCE
@@ -233,6 +362,7 @@ class LearningEngine:
         task_type: TaskType,
         new_score: float,
         sample_count: int,
+        now: Optional[datetime] = None,
     ) -> None:
         """
         Update confidence score with smoothing.
@@ -242,7 +372,9 @@ class LearningEngine:
             task_type: Type of task
             new_score: Newly calculated score
             sample_count: Number of samples used
+            now: Update timestamp, shared across a batch (default: now)
         """
+        now = now or datetime.now()
         key = (model_name, task_type)
         old_score_obj = self._confidence_scores.get(key)
         old_score = old_score_obj.score if old_score_obj else self.DEFAULT_CONFIDENCE
@@ -253,14 +385,19 @@ class LearningEngine:
             (1 - self.smoothing_factor) * old_score
         )
         
-        # Create or update score object
-        self._confidence_scores[key] = ConfidenceScore(
-            model_name=model_name,
-            task_type=task_type,
-            score=smoothed_score,
-            sample_count=sample_count,
-            last_updated=datetime.now(),
-        )
+        # Create or update score object (carrying over the EWMA state)
+        if old_score_obj is None:
+            self._store_score(ConfidenceScore(
+                model_name=model_name,
+                task_type=task_type,
+                score=smoothed_score,
+                sample_count=sample_count,
+                last_updated=now,
+            ))
+        else:
+            self._store_score(
+                old_score_obj.updated(smoothed_score, sample_count, now)
+            )
         
         # Log significant changes
         if abs(new_score - old_score) > 0.1:
@@ -301,11 +438,38 @@ class LearningEngine:
         Returns:
             Dictionary of (model, task_type) -> score
         """
-        result = {}
-        for key, score_obj in self._confidence_scores.items():
-            if model_name is None or key[0] == model_name:
-                result[key] = score_obj.score
-        return result
+        items = list(self._confidence_scores.items())
+        if model_name is None:
+            return {key: score_obj.score for key, score_obj in items}
+        return {
+            key: score_obj.score
+            for key, score_obj in items
+            if key[0] == model_name
+        }
+    
+    def get_scores_by_storage_key(self) -> Dict[str, float]:
+        """
+        Get all confidence scores keyed as in the persisted scores file.
+        
+        Returns:
+            Dictionary of "<model>_<task_type>" -> score
+        """
+        return {
+            score_obj.storage_key: score_obj.score
+            for score_obj in list(self._confidence_scores.values())
+        }
+    
+    def get_all_scores_for_task(self, task_type: TaskType) -> Dict[str, float]:
+        """
+        Get all confidence scores for a task type.
+        
+        Args:
+            task_type: Type of task
+            
+        Returns:
+            Dictionary of model name -> score
+        """
+        return dict(self._task_scores.get(task_type, {}))
     
     def get_performance_report(
         self,
@@ -324,23 +488,19 @@ class LearningEngine:
         Returns:
             PerformanceReport with aggregated metrics
         """
-        # Query history with filters
-        history = self.storage.query_performance_history(
-            model_name=model_name,
-            task_type=task_type,
-            limit=10000,
-        )
-        
-        # Apply time range filter
         time_range_start = None
         time_range_end = datetime.now()
         
         if time_range_days:
             time_range_start = time_range_end - timedelta(days=time_range_days)
-            history = [
-                r for r in history 
-                if r.timestamp >= time_range_start
-            ]
+        
+        # Query history with filters (time range applied while reading)
+        history = self.storage.query_performance_history(
+            model_name=model_name,
+            task_type=task_type,
+            limit=10000,
+            start_time=time_range_start,
+        )
         
         if not history:
             return PerformanceReport(
@@ -355,12 +515,24 @@ class LearningEngine:
                 time_range_end=time_range_end,
             )
         
-        # Calculate metrics
+        # Calculate metrics as column reductions; the attribute walks run
+        # in C via map/attrgetter rather than a Python-level loop
         total = len(history)
-        correct = sum(1 for r in history if r.was_correct)
+        if np is not None:
+            correct = int(np.count_nonzero(
+                np.fromiter(map(_was_correct, history), dtype=np.bool_, count=total)
+            ))
+            avg_response_time = float(
+                np.fromiter(map(_response_time, history), dtype=np.float64, count=total).mean()
+            )
+            avg_cost = float(
+                np.fromiter(map(_cost, history), dtype=np.float64, count=total).mean()
+            )
+        else:
+            correct = sum(map(_was_correct, history))
+            avg_response_time = sum(map(_response_time, history)) / total
+            avg_cost = sum(map(_cost, history)) / total
         accuracy = correct / total
-        avg_response_time = sum(r.response_time for r in history) / total
-        avg_cost = sum(r.cost for r in history) / total
         
         # Get confidence score
         if model_name and task_type:
@@ -395,15 +567,12 @@ class LearningEngine:
         Returns:
             Model name or None if no model meets threshold
         """
-        best_model = None
-        best_score = min_confidence
+        scores = self._task_scores.get(task_type)
+        if not scores:
+            return None
         
-        for (model_name, tt), score_obj in self._confidence_scores.items():
-            if tt == task_type and score_obj.score > best_score:
-                best_score = score_obj.score
-                best_model = model_name
-        
-        return best_model
+        best_model = max(scores, key=scores.__getitem__)
+        return best_model if scores[best_model] > min_confidence else None
     
     def get_models_above_threshold(
         self,
@@ -420,11 +589,11 @@ class LearningEngine:
         Returns:
             List of (model_name, score) tuples, sorted by score descending
         """
-        models = []
-        
-        for (model_name, tt), score_obj in self._confidence_scores.items():
-            if tt == task_type and score_obj.score >= threshold:
-                models.append((model_name, score_obj.score))
+        models = [
+            (model_name, score)
+            for model_name, score in self._task_scores.get(task_type, {}).items()
+            if score >= threshold
+        ]
         
         # Sort by score descending
         models.sort(key=lambda x: x[1], reverse=True)
@@ -448,6 +617,83 @@ class LearningEngine:
             was_correct: Whether the response was correct
             weight: Weight of this feedback (default 1.0)
         """
+        old_score, new_score = self._adjust_score(
+            model_name, task_type, was_correct, weight
+        )
+        self._maybe_save()
+        
+        logger.debug(
+            f"Applied feedback to {model_name}/{task_type.value}: "
+            f"{old_score:.3f} → {new_score:.3f}"
+        )
+    
+    def apply_feedback_batch(
+        self,
+        items: List[Tuple[str, TaskType, bool, float]],
+    ) -> None:
+        """
+        Apply immediate feedback for several model-task pairs at once.
+        
+        Args:
+            items: (model_name, task_type, was_correct, weight) tuples
+        """
+        if not items:
+            return
+        
+        now = datetime.now()
+        for model_name, task_type, was_correct, weight in items:
+            self._adjust_score(model_name, task_type, was_correct, weight, now)
+        self._maybe_save()
+        
+        logger.debug(f"Applied feedback batch of {len(items)} entries")
+    
+    def record_batch(self, entries: List[BatchEntry]) -> None:
+        """
+        Record performance and apply feedback for several models at once.
+        
+        The performance records are appended to storage in a single call,
+        so the storage lock is taken once per batch rather than per model.
+        
+        Args:
+            entries: BatchEntry tuples, one per model response
+        """
+        if not entries:
+            return
+        
+        now = datetime.now()
+        records = [
+            PerformanceRecord(
+                timestamp=now,
+                model_name=model_name,
+                task_type=task_type,
+                was_correct=was_correct,
+                response_time=response_time,
+                cost=cost,
+                token_count=token_count,
+                request_id=request_id,
+            )
+            for (model_name, task_type, was_correct, response_time, cost,
+                 token_count, request_id, _weight) in entries
+        ]
+        self._ensure_ewma_seeded()
+        self.storage.append_performance_records_batch(records)
+        
+        for model_name, task_type, was_correct, _, _, _, _, weight in entries:
+            self._update_ewma(model_name, task_type, was_correct)
+            self._adjust_score(model_name, task_type, was_correct, weight, now)
+        self._maybe_save()
+        
+        logger.debug(f"Recorded batch of {len(entries)} performance entries")
+    
+    def _adjust_score(
+        self,
+        model_name: str,
+        task_type: TaskType,
+        was_correct: bool,
+        weight: float,
+        now: Optional[datetime] = None,
+    ) -> Tuple[float, float]:
+        """Apply a bounded feedback adjustment, returning (old, new) scores."""
         key = (model_name, task_type)
         current = self._confidence_scores.get(key)
         
@@ -468,15 +714,7 @@ class LearningEngine:
         # Apply adjustment with bounds
         new_score = max(0.0, min(1.0, current.score + adjustment))
         
-        self._confidence_scores[key] = ConfidenceScore(
-            model_name=model_name,
-            task_type=task_type,
-            score=new_score,
-            sample_count=current.sample_count + 1,
-            last_updated=datetime.now(),
-        )
-        
-        logger.debug(
-            f"Applied feedback to {model_name}/{task_type.value}: "
-            f"{current.score:.3f} → {new_score:.3f}"
-        )
+        self._store_score(current.updated(
+            new_score, current.sample_count + 1, now or datetime.now()
+        ))
+        return current.score, new_score
@@ -5,20 +5,132 @@ This module implements merging of results from multiple AI models
 using confidence-based weighting.
 """
 
+import copy
 import json
 import logging
 import re
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
-from .models import MergedResult, TaskType
+from .models import MergedResult, TaskType, with_slots
 from .adapters.base import AdapterResponse
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# JSON extraction patterns, compiled once. The array/object patterns stay
+# greedy so nested brackets are captured up to the outermost close.
+_CODE_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+_ARRAY_RE = re.compile(r'\[[\s\S]*\]')
+_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+
+# Sentinel for content with no parseable JSON (None is a valid result)
+_NO_JSON = object()
+
+
+def _parse_json_content(content: str) -> Any:
+    """
+    Parse JSON from a response body, returning _NO_JSON if none is found.
+    
+    Cheapest tests first: content that starts like JSON is parsed without
+    any regex, and each regex only runs when its delimiter is present.
+    """
+    direct_failed = False
+    if content[:1] in ("{", "["):
+        try:
+            return _json_loads(content)
+        except json.JSONDecodeError:
+            direct_failed = True
+    
+    # Try to extract JSON from markdown code blocks
+    if "```" in content:
+        json_match = _CODE_FENCE_RE.search(content)
+        if json_match:
+            content = json_match.group(1).strip()
+            direct_failed = False
+    
+    if not direct_failed:
+        try:
+            return _json_loads(content)
+        except json.JSONDecodeError:
+            pass
+    
+    # Try to find JSON array or object in the content
+    array_match = _ARRAY_RE.search(content) if "[" in content else None
+    if array_match:
+        try:
+            return _json_loads(array_match.group())
+        except json.JSONDecodeError:
+            return _NO_JSON
+    
+    if "{" in content:
+        obj_match = _OBJECT_RE.search(content)
+        if obj_match:
+            try:
+                return _json_loads(obj_match.group())
+            except json.JSONDecodeError:
+                pass
+    
+    return _NO_JSON
+
+
+def _canonical_key(value: Any) -> bytes:
+    """
+    Order-independent serialized form of a value, used to compare results.
+    
+    The full serialization is the key, so distinct values never share one.
+    Values JSON cannot encode fall back to a tagged ``str()`` form.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        return json.dumps(
+            value, sort_keys=True, separators=(",", ":")
+        ).encode()
+    except (TypeError, ValueError):
+        return b"\0" + str(value).encode()
+
+
+# Values whose (type, value) pair already identifies their canonical JSON
+_EXACT_KEY_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _canonicalizer() -> Callable[[Any], Hashable]:
+    """
+    Create a per-merge memo of canonical keys, keyed by object identity.
+    
+    Strings, ints, bools and None are keyed by ``(type, value)`` directly,
+    which equals iff their canonical JSON does, so they skip serialization
+    altogether. Each memo entry keeps its object alive, so an id cannot be
+    reused for a different object while the memo exists.
+    """
+    memo: Dict[int, Tuple[Any, bytes]] = {}
+    
+    def canon(value: Any) -> Hashable:
+        value_type = type(value)
+        if value_type in _EXACT_KEY_TYPES:
+            return (value_type, value)
+        hit = memo.get(id(value))
+        if hit is not None:
+            return hit[1]
+        key = _canonical_key(value)
+        memo[id(value)] = (value, key)
+        return key
+    
+    return canon
+
 
+@with_slots
 @dataclass
 class MergeMetadata:
     """Metadata about the merge operation."""
@@ -42,17 +154,28 @@ class ConfidenceWeightedMerger:
     # Threshold below which all models are considered low confidence
     LOW_CONFIDENCE_THRESHOLD = 0.4
     
+    # Default number of merge results kept for repeated merges
+    DEFAULT_RESULT_CACHE_SIZE = 512
+    
     def __init__(
         self,
         low_confidence_threshold: float = 0.4,
+        result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
     ):
         """
         Initialize the merger.
         
         Args:
             low_confidence_threshold: Threshold for flagging low confidence
+            result_cache_size: Merge results to memoize (0 disables)
         """
         self.low_confidence_threshold = low_confidence_threshold
+        self.result_cache_size = result_cache_size
+        
+        # LRU of merge results keyed by (task type, threshold, contents,
+        # confidences)
+        self._results: "OrderedDict[Tuple, MergedResult]" = OrderedDict()
+        self._results_lock = threading.Lock()
     
     def merge(
         self,
@@ -70,6 +193,12 @@ class ConfidenceWeightedMerger:
             
         Returns:
             MergedResult with merged data and metadata
+        
+        The result is a pure function of the successful responses' contents,
+        their confidence scores, the task type and the low-confidence
+        threshold, so repeated merges are served from a small LRU. Every
+        call gets its own copy of the merged ``data`` and containers, so
+        callers may mutate the result without affecting the cache.
         """
         # Filter successful responses
         successful = {
@@ -77,10 +206,46 @@ class ConfidenceWeightedMerger:
             if resp.success and resp.content
         }
         
+        if not successful or self.result_cache_size <= 0:
+            return self._merge(successful, confidence_scores, task_type)
+        
+        key = (
+            task_type,
+            self.low_confidence_threshold,
+            tuple((name, resp.content) for name, resp in successful.items()),
+            tuple(confidence_scores.get(name, 0.5) for name in successful),
+        )
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+        
+        if cached is None:
+            cached = self._merge(successful, confidence_scores, task_type)
+            with self._results_lock:
+                self._results[key] = cached
+                if len(self._results) > self.result_cache_size:
+                    self._results.popitem(last=False)
+        
+        # Callers get their own copies (the model tuple is immutable and shared)
+        return replace(
+            cached,
+            data=copy.deepcopy(cached.data),
+            confidence_scores=dict(cached.confidence_scores),
+            metadata=dict(cached.metadata),
+        )
+    
+    def _merge(
+        self,
+        successful: Dict[str, AdapterResponse],
+        confidence_scores: Dict[str, float],
+        task_type: TaskType,
+    ) -> MergedResult:
+        """Merge the successful responses (uncached)."""
         if not successful:
             return MergedResult(
                 data=None,
-                contributing_models=[],
+                contributing_models=(),
                 confidence_scores={},
                 metadata={"error": "No successful responses to merge"},
                 flagged_for_review=True,
@@ -108,7 +273,7 @@ class ConfidenceWeightedMerger:
         
         return MergedResult(
             data=merged_data,
-            contributing_models=list(successful.keys()),
+            contributing_models=tuple(successful),
             confidence_scores={
                 name: confidence_scores.get(name, 0.5)
                 for name in successful
@@ -130,30 +295,9 @@ class ConfidenceWeightedMerger:
         parsed = {}
         
         for name, resp in responses.items():
-            content = resp.content.strip()
-            
-            # Try to extract JSON from markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', content)
-            if json_match:
-                content = json_match.group(1).strip()
-            
-            try:
-                parsed[name] = json.loads(content)
-            except json.JSONDecodeError:
-                # Try to find JSON array or object in the content
-                array_match = re.search(r'\[[\s\S]*\]', content)
-                obj_match = re.search(r'\{[\s\S]*\}', content)
-                
-                if array_match:
-                    try:
-                        parsed[name] = json.loads(array_match.group())
-                    except json.JSONDecodeError:
-                        pass
-                elif obj_match:
-                    try:
-                        parsed[name] = json.loads(obj_match.group())
-                    except json.JSONDecodeError:
-                        pass
+            value = _parse_json_content(resp.content.strip())
+            if value is not _NO_JSON:
+                parsed[name] = value
         
         # Return parsed if at least half of responses were parsed
         if len(parsed) >= len(responses) / 2:
@@ -166,17 +310,20 @@ class ConfidenceWeightedMerger:
         confidence_scores: Dict[str, float],
     ) -> Tuple[Any, MergeMetadata]:
         """Merge structured (JSON) data."""
+        # Canonical keys are computed at most once per object in this merge
+        canon = _canonicalizer()
+        
         # Check if all responses are lists
         all_lists = all(isinstance(v, list) for v in parsed_responses.values())
         
         if all_lists:
-            return self._merge_list_data(parsed_responses, confidence_scores)
+            return self._merge_list_data(parsed_responses, confidence_scores, canon)
         
         # Check if all responses are dicts
         all_dicts = all(isinstance(v, dict) for v in parsed_responses.values())
         
         if all_dicts:
-            return self._merge_dict_data(parsed_responses, confidence_scores)
+            return self._merge_dict_data(parsed_responses, confidence_scores, canon)
         
         # Mixed types - use highest confidence
         return self._select_highest_confidence(parsed_responses, confidence_scores)
@@ -185,6 +332,7 @@ class ConfidenceWeightedMerger:
         self,
         parsed_responses: Dict[str, List],
         confidence_scores: Dict[str, float],
+        canon: Optional[Callable[[Any], Hashable]] = None,
     ) -> Tuple[List, MergeMetadata]:
         """Merge list data using weighted voting."""
         # If only one response, return it
@@ -205,9 +353,10 @@ class ConfidenceWeightedMerger:
         
         # If items have identifiable keys, group and vote
         # Otherwise, use union with deduplication
-        merged = self._deduplicate_items(all_items, confidence_scores)
+        canon = canon or _canonicalizer()
+        merged = self._deduplicate_items(all_items, confidence_scores, canon)
         
-        agreeing = self._count_agreeing_models(parsed_responses)
+        agreeing = self._count_agreeing_models(parsed_responses, canon)
         
         return merged, MergeMetadata(
             total_models=len(parsed_responses),
@@ -219,8 +368,19 @@ class ConfidenceWeightedMerger:
         self,
         parsed_responses: Dict[str, Dict],
         confidence_scores: Dict[str, float],
+        canon: Optional[Callable[[Any], Hashable]] = None,
     ) -> Tuple[Dict, MergeMetadata]:
         """Merge dictionary data."""
+        canon = canon or _canonicalizer()
+        
+        # Identical responses merge to themselves; skip the per-key vote
+        if self._all_agree(parsed_responses, canon):
+            return dict(next(iter(parsed_responses.values()))), MergeMetadata(
+                total_models=len(parsed_responses),
+                agreeing_models=len(parsed_responses),
+                merge_method="dict_merge",
+            )
+        
         # Collect all keys
         all_keys = set()
         for data in parsed_responses.values():
@@ -236,9 +396,9 @@ class ConfidenceWeightedMerger:
             
             if values:
                 # Use weighted voting for this key
-                merged[key] = self._weighted_vote(values)
+                merged[key] = self._weighted_vote(values, canon)
         
-        agreeing = self._count_agreeing_models(parsed_responses)
+        agreeing = self._count_agreeing_models(parsed_responses, canon)
         
         return merged, MergeMetadata(
             total_models=len(parsed_responses),
@@ -293,12 +453,14 @@ class ConfidenceWeightedMerger:
     def _weighted_vote(
         self,
         candidates: List[Tuple[str, Any, float]],
+        canon: Optional[Callable[[Any], Hashable]] = None,
     ) -> Any:
         """
         Perform weighted voting on candidates.
         
         Args:
             candidates: List of (model_name, value, confidence) tuples
+            canon: Optional memoizing canonical-key function
             
         Returns:
             The winning value
@@ -309,39 +471,36 @@ class ConfidenceWeightedMerger:
         if len(candidates) == 1:
             return candidates[0][1]
         
-        # Group by value (using string representation for comparison)
-        value_groups: Dict[str, List[Tuple[str, Any, float]]] = defaultdict(list)
-        
-        for name, value, confidence in candidates:
-            # Use JSON string for comparison
-            try:
-                key = json.dumps(value, sort_keys=True)
-            except (TypeError, ValueError):
-                key = str(value)
-            value_groups[key].append((name, value, confidence))
+        # Sum confidence per distinct value (grouped by canonical key),
+        # keeping the first value seen as each group's representative
+        canon = canon or _canonicalizer()
+        scores: Dict[Hashable, float] = {}
+        representatives: Dict[Hashable, Any] = {}
         
-        # Calculate weighted score for each value
-        scores = {}
-        for key, group in value_groups.items():
-            scores[key] = sum(conf for _, _, conf in group)
+        for _, value, confidence in candidates:
+            key = canon(value)
+            if key in scores:
+                scores[key] += confidence
+            else:
+                scores[key] = confidence
+                representatives[key] = value
         
         # Return value with highest weighted score
         best_key = max(scores, key=scores.get)
-        return value_groups[best_key][0][1]
+        return representatives[best_key]
     
     def _deduplicate_items(
         self,
         all_items: List[Tuple[str, Any, float]],
         confidence_scores: Dict[str, float],
+        canon: Optional[Callable[[Any], Hashable]] = None,
     ) -> List:
         """Deduplicate items from multiple sources."""
+        canon = canon or _canonicalizer()
         seen = {}
         
         for name, item, confidence in all_items:
-            try:
-                key = json.dumps(item, sort_keys=True)
-            except (TypeError, ValueError):
-                key = str(item)
+            key = canon(item)
             
             if key not in seen or confidence > seen[key][1]:
                 seen[key] = (item, confidence)
@@ -351,22 +510,51 @@ class ConfidenceWeightedMerger:
     def _count_agreeing_models(
         self,
         parsed_responses: Dict[str, Any],
+        canon: Optional[Callable[[Any], Hashable]] = None,
     ) -> int:
         """Count how many models agree on the same result."""
         if len(parsed_responses) <= 1:
             return len(parsed_responses)
         
-        # Compare responses
+        # Compare responses against the first one
+        canon = canon or _canonicalizer()
         values = list(parsed_responses.values())
         first = values[0]
         
-        agreeing = 1
-        for other in values[1:]:
-            try:
-                if json.dumps(first, sort_keys=True) == json.dumps(other, sort_keys=True):
-                    agreeing += 1
-            except (TypeError, ValueError):
-                if str(first) == str(other):
-                    agreeing += 1
+        return 1 + sum(1 for other in values[1:] if self._agrees(first, other, canon))
+    
+    def _all_agree(
+        self,
+        parsed_responses: Dict[str, Any],
+        canon: Optional[Callable[[Any], Hashable]] = None,
+    ) -> bool:
+        """Check whether all models agree, stopping at the first mismatch."""
+        canon = canon or _canonicalizer()
+        values = iter(parsed_responses.values())
+        first = next(values, None)
+        for other in values:
+            if not self._agrees(first, other, canon):
+                return False
+        return True
+    
+    @staticmethod
+    def _agrees(first: Any, other: Any, canon: Callable[[Any], Hashable]) -> bool:
+        """
+        Check whether two responses have the same canonical form.
         
-        return agreeing
+        Dicts and lists are compared member by member, so the check stops at
+        the first differing member and reuses canonical keys already memoized
+        for those members by the vote and deduplication.
+        """
+        if first is other:
+            return True
+        if isinstance(first, dict) and isinstance(other, dict):
+            return len(first) == len(other) and all(
+                key in other and canon(value) == canon(other[key])
+                for key, value in first.items()
+            )
+        if isinstance(first, list) and isinstance(other, list):
+            return len(first) == len(other) and all(
+                canon(a) == canon(b) for a, b in zip(first, other)
+            )
+        return canon(first) == canon(other)
@@ -5,16 +5,170 @@ This module defines all core data structures used throughout the AI Orchestrator
 including validation logic to ensure data integrity.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
-import uuid
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
+import json
+import os
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Compact JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def with_slots(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10+.
+    Apply it above ``@dataclass``. Instances then carry no ``__dict__``,
+    which matters for types created in large numbers.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = names
+    for name in names:
+        # Field defaults live in the generated __init__, not on the class
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# Resolution of coarse_now(), in seconds
+_COARSE_NOW_RESOLUTION = 0.001
+
+# (epoch seconds, datetime) of the last coarse_now() refresh, swapped as a
+# whole so readers never see a mismatched pair
+_coarse_now_cache: Tuple[float, datetime] = (0.0, datetime.fromtimestamp(0))
+
+
+def coarse_now() -> datetime:
+    """
+    Current local time, at most ``_COARSE_NOW_RESOLUTION`` stale.
+    
+    Used as the default timestamp factory: objects created within the same
+    millisecond share one (immutable) datetime instead of each paying for
+    ``datetime.now()``.
+    """
+    global _coarse_now_cache
+    now = time.time()
+    cached_at, cached = _coarse_now_cache
+    if 0.0 <= now - cached_at < _COARSE_NOW_RESOLUTION:
+        return cached
+    cached = datetime.fromtimestamp(now)
+    _coarse_now_cache = (now, cached)
+    return cached
+
+
+# (datetime, isoformat string) of the last _isoformat() call
+_isoformat_cache: Tuple[Optional[datetime], str] = (None, "")
+
+
+def _isoformat(dt: datetime) -> str:
+    """
+    ``dt.isoformat()``, reusing the last result for the same datetime object.
+    
+    Batched records and coarse_now() defaults share datetime objects, so
+    consecutive to_dict() calls often format the same one.
+    """
+    global _isoformat_cache
+    cached_dt, cached = _isoformat_cache
+    if dt is cached_dt:
+        return cached
+    cached = dt.isoformat()
+    _isoformat_cache = (dt, cached)
+    return cached
+
+
+_fromisoformat_cache: Tuple[Optional[str], Optional[datetime]] = (None, None)
+
+
+def parse_isoformat(text: str) -> datetime:
+    """
+    ``datetime.fromisoformat(text)``, reusing the last result for the same text.
+    
+    Records written in one batch share a coarse_now() timestamp, so loading
+    history parses runs of identical strings. Datetimes are immutable, so
+    handing out the same object is safe.
+    """
+    global _fromisoformat_cache
+    cached_text, cached = _fromisoformat_cache
+    if text == cached_text:
+        return cached
+    cached = datetime.fromisoformat(text)
+    _fromisoformat_cache = (text, cached)
+    return cached
+
+
+def fast_init(check: str):
+    """
+    Replace a dataclass ``__init__`` with one that inlines a validity check.
+    
+    The generated ``__init__`` assigns the fields, then evaluates ``check``
+    (an expression over the field names as locals) and only calls
+    ``self.validate()`` when it is false. Well-formed instances therefore
+    skip the ``__post_init__`` and ``validate`` calls entirely. Apply it
+    above ``@dataclass``, to classes whose ``__post_init__`` only validates.
+    """
+    def decorate(cls):
+        namespace: Dict[str, Any] = {"_MISSING": MISSING}
+        params, body = [], []
+        for f in fields(cls):
+            if not f.init:
+                continue
+            if f.default is not MISSING:
+                namespace[f"_dflt_{f.name}"] = f.default
+                params.append(f"{f.name}=_dflt_{f.name}")
+            elif f.default_factory is not MISSING:
+                namespace[f"_factory_{f.name}"] = f.default_factory
+                params.append(f"{f.name}=_MISSING")
+                body.append(f" if {f.name} is _MISSING: {f.name} = _factory_{f.name}()")
+            else:
+                params.append(f.name)
+            body.append(f" self.{f.name} = {f.name}")
+        body.append(f" if not ({check}): self.validate()")
+        source = f"def __init__(self, {', '.join(params)}):\n" + "\n".join(body)
+        
+        module_globals = dict(sys.modules[cls.__module__].__dict__)
+        module_globals.update(namespace)
+        exec(source, module_globals, namespace)
+        init = namespace["__init__"]
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+        cls.__init__ = init
+        return cls
+    
+    return decorate
 
 
 class ValidationError(Exception):
-    """Raised when data validation fails."""
-    pass
+    """
+    Raised when data validation fails.
+    
+    Takes either a finished message or a ``str.format`` template followed by
+    its arguments. A template is only formatted when the message is read, so
+    callers that catch and drop validation errors never build it.
+    """
+    
+    def __str__(self) -> str:
+        if len(self.args) > 1:
+            return self.args[0].format(*self.args[1:])
+        return super().__str__()
 
 
 class TaskType(Enum):
@@ -26,50 +180,105 @@ class TaskType(Enum):
     HISTORICAL_ANALYSIS = "historical_analysis"
 
 
+# Value -> member map maintained by Enum; a plain dict lookup skips
+# Enum.__call__ when deserializing
+_TASK_TYPES_BY_VALUE = TaskType._value2member_map_
+
+
+def _task_type_from_value(value: str) -> TaskType:
+    """Look up a TaskType by value, raising ValueError like TaskType(value)."""
+    try:
+        member = _TASK_TYPES_BY_VALUE.get(value)
+    except TypeError:  # Unhashable; let Enum report it
+        member = None
+    if member is None:
+        return TaskType(value)
+    return member
+
+
+# ("_<value>", member) pairs for splitting ConfidenceScore.storage_key back
+# into model name and task type; built once instead of per stored key
+TASK_TYPE_KEY_SUFFIXES: Tuple[Tuple[str, TaskType], ...] = tuple(
+    (f"_{task_type._value_}", task_type) for task_type in TaskType
+)
+
+# Required keys of each from_dict(), fetched in a single C call
+_RESPONSE_KEYS = itemgetter(
+    "model_name", "content", "response_time", "token_count", "cost", "timestamp"
+)
+_AI_MODEL_KEYS = itemgetter(
+    "name", "provider", "cost_per_1m_tokens", "avg_response_time"
+)
+_PERFORMANCE_RECORD_KEYS = itemgetter(
+    "timestamp", "model", "task_type", "was_correct",
+    "response_time", "cost", "token_count",
+)
+
+
 def validate_confidence_score(score: float, field_name: str = "confidence_score") -> float:
     """Validate that a confidence score is within [0, 1] range."""
+    # Fast path: an in-range float is returned as is
+    if score.__class__ is float and 0.0 <= score <= 1.0:
+        return score
     if not isinstance(score, (int, float)):
-        raise ValidationError(f"{field_name} must be a number, got {type(score).__name__}")
+        raise ValidationError("{} must be a number, got {.__name__}", field_name, type(score))
     if score < 0.0 or score > 1.0:
-        raise ValidationError(f"{field_name} must be between 0 and 1, got {score}")
+        raise ValidationError("{} must be between 0 and 1, got {}", field_name, score)
     return float(score)
 
 
 def validate_positive_number(value: float, field_name: str, allow_zero: bool = True) -> float:
     """Validate that a number is positive (or non-negative if allow_zero)."""
+    # Fast path: a positive float needs no further checks
+    if value.__class__ is float and value > 0.0:
+        return value
     if not isinstance(value, (int, float)):
-        raise ValidationError(f"{field_name} must be a number, got {type(value).__name__}")
+        raise ValidationError("{} must be a number, got {.__name__}", field_name, type(value))
     if allow_zero and value < 0:
-        raise ValidationError(f"{field_name} must be non-negative, got {value}")
+        raise ValidationError("{} must be non-negative, got {}", field_name, value)
     if not allow_zero and value <= 0:
-        raise ValidationError(f"{field_name} must be positive, got {value}")
+        raise ValidationError("{} must be positive, got {}", field_name, value)
     return float(value)
 
 
+def new_request_id() -> str:
+    """
+    Generate a random (version 4) UUID string.
+    
+    Formats 16 random bytes directly, which is equivalent to
+    ``str(uuid.uuid4())`` without building a UUID object.
+    """
+    h = os.urandom(16).hex()
+    return (
+        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-"
+        f"{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+    )
+
+
 def validate_non_empty_string(value: str, field_name: str) -> str:
     """Validate that a string is non-empty."""
+    # Fast path: a str starting with a non-space character
+    if value.__class__ is str and value[:1].strip():
+        return value
     if not isinstance(value, str):
-        raise ValidationError(f"{field_name} must be a string, got {type(value).__name__}")
+        raise ValidationError("{} must be a string, got {.__name__}", field_name, type(value))
     if not value.strip():
-        raise ValidationError(f"{field_name} cannot be empty")
+        raise ValidationError("{} cannot be empty", field_name)
     return value
 
 
+@with_slots
 @dataclass
 class Request:
     """Represents an incoming request to the AI orchestrator."""
     id: str
     prompt: str
     context: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=coarse_now)
     quality_threshold: float = 0.8
     cost_limit: Optional[float] = None
     task_type: Optional[TaskType] = None
     
-    def __post_init__(self):
-        """Validate request data after initialization."""
-        self.validate()
-    
     def validate(self) -> None:
         """Validate all request fields."""
         validate_non_empty_string(self.id, "id")
@@ -78,16 +287,27 @@ class Request:
         if self.cost_limit is not None:
             validate_positive_number(self.cost_limit, "cost_limit", allow_zero=False)
     
+    # Validate after initialization; an alias rather than a wrapper saves
+    # a call per construction
+    __post_init__ = validate
+    
     @classmethod
     def create(cls, prompt: str, **kwargs) -> 'Request':
         """Factory method to create a request with auto-generated ID."""
         return cls(
-            id=str(uuid.uuid4()),
+            id=new_request_id(),
             prompt=prompt,
             **kwargs
         )
 
 
+@with_slots
+@fast_init(
+    "model_name.__class__ is str and model_name[:1].strip()"
+    " and response_time.__class__ is float and response_time >= 0.0"
+    " and token_count.__class__ is int and token_count >= 0"
+    " and cost.__class__ is float and cost >= 0.0"
+)
 @dataclass
 class Response:
     """Represents a response from an AI model."""
@@ -96,13 +316,12 @@ class Response:
     response_time: float
     token_count: int
     cost: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=coarse_now)
     success: bool = True
     error: Optional[str] = None
     
-    def __post_init__(self):
-        """Validate response data after initialization."""
-        self.validate()
+    # __init__ is generated by fast_init: well-formed responses skip
+    # validate(), anything else goes through it for its errors
     
     def validate(self) -> None:
         """Validate all response fields."""
@@ -120,7 +339,7 @@ class Response:
             "response_time": self.response_time,
             "token_count": self.token_count,
             "cost": self.cost,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _isoformat(self.timestamp),
             "success": self.success,
             "error": self.error
         }
@@ -128,18 +347,18 @@ class Response:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Response':
         """Create from dictionary."""
+        model_name, content, response_time, token_count, cost, timestamp = (
+            _RESPONSE_KEYS(data)
+        )
         return cls(
-            model_name=data["model_name"],
-            content=data["content"],
-            response_time=data["response_time"],
-            token_count=data["token_count"],
-            cost=data["cost"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            success=data.get("success", True),
-            error=data.get("error")
+            model_name, content, response_time, token_count, cost,
+            parse_isoformat(timestamp),
+            data.get("success", True),
+            data.get("error"),
         )
 
 
+@with_slots
 @dataclass
 class AIModel:
     """Represents an AI model configuration."""
@@ -148,10 +367,26 @@ class AIModel:
     cost_per_1m_tokens: float
     avg_response_time: float
     enabled: bool = True
+    cost_per_request: float = field(init=False, repr=False, compare=False)
+    _name_hash: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate AI model data after initialization."""
         self.validate()
+        # Identity is the name; models are hashed on every set/dict lookup.
+        # __setattr__ keeps the name fixed, so the memoized hash stays valid
+        self._name_hash = hash(self.name)
+    
+    def __setattr__(self, attr: str, value: Any) -> None:
+        if attr == "name" and hasattr(self, "_name_hash"):
+            raise AttributeError(
+                "AIModel.name is read-only: it is the model's hash and identity"
+            )
+        object.__setattr__(self, attr, value)
+        if attr == "cost_per_1m_tokens":
+            # Estimated cost of a typical ~1000 token request, kept in step
+            # with every assignment to the token price
+            object.__setattr__(self, "cost_per_request", value * 1e-3)
     
     def validate(self) -> None:
         """Validate all AI model fields."""
@@ -161,9 +396,11 @@ class AIModel:
         validate_positive_number(self.avg_response_time, "avg_response_time", allow_zero=False)
     
     def __hash__(self):
-        return hash(self.name)
+        return self._name_hash
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, AIModel):
             return self.name == other.name
         return False
@@ -181,15 +418,25 @@ class AIModel:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AIModel':
         """Create from dictionary."""
+        name, provider, cost_per_1m_tokens, avg_response_time = _AI_MODEL_KEYS(data)
         return cls(
-            name=data["name"],
-            provider=data["provider"],
-            cost_per_1m_tokens=data["cost_per_1m_tokens"],
-            avg_response_time=data["avg_response_time"],
+            name=name,
+            provider=provider,
+            cost_per_1m_tokens=cost_per_1m_tokens,
+            avg_response_time=avg_response_time,
             enabled=data.get("enabled", True)
         )
 
 
+@with_slots
+@fast_init(
+    "model_name.__class__ is str and model_name[:1].strip()"
+    " and task_type.__class__ is TaskType"
+    " and was_correct.__class__ is bool"
+    " and response_time.__class__ is float and response_time >= 0.0"
+    " and cost.__class__ is float and cost >= 0.0"
+    " and token_count.__class__ is int and token_count >= 0"
+)
 @dataclass
 class PerformanceRecord:
     """Records performance data for an AI model."""
@@ -202,9 +449,8 @@ class PerformanceRecord:
     token_count: int
     request_id: Optional[str] = None
     
-    def __post_init__(self):
-        """Validate performance record data after initialization."""
-        self.validate()
+    # __init__ is generated by fast_init: well-formed records skip
+    # validate(), anything else goes through it for its errors
     
     def validate(self) -> None:
         """Validate all performance record fields."""
@@ -221,9 +467,9 @@ class PerformanceRecord:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _isoformat(self.timestamp),
             "model": self.model_name,
-            "task_type": self.task_type.value,
+            "task_type": self.task_type._value_,
             "was_correct": self.was_correct,
             "response_time": self.response_time,
             "cost": self.cost,
@@ -233,50 +479,72 @@ class PerformanceRecord:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PerformanceRecord':
-        """Create from dictionary."""
+        """
+        Create from dictionary.
+        
+        The model name is interned: history holds many records for a handful
+        of models, and each parsed line would otherwise carry its own copy.
+        """
+        (timestamp, model_name, task_type, was_correct,
+         response_time, cost, token_count) = _PERFORMANCE_RECORD_KEYS(data)
         return cls(
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            model_name=data["model"],
-            task_type=TaskType(data["task_type"]),
-            was_correct=data["was_correct"],
-            response_time=data["response_time"],
-            cost=data["cost"],
-            token_count=data["token_count"],
-            request_id=data.get("request_id")
+            parse_isoformat(timestamp),
+            sys.intern(model_name),
+            _task_type_from_value(task_type),
+            was_correct,
+            response_time,
+            cost,
+            token_count,
+            data.get("request_id"),
         )
+    
+    def to_json(self) -> bytes:
+        """Serialize to compact JSON bytes (one performance history line)."""
+        return _dumps(self.to_dict())
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> 'PerformanceRecord':
+        """Parse and validate one performance history line."""
+        return cls.from_dict(_loads(data))
 
 
+@with_slots
 @dataclass
 class MergedResult:
     """Represents a merged result from multiple AI models."""
     data: Any
-    contributing_models: List[str]
+    contributing_models: Tuple[str, ...]
     confidence_scores: Dict[str, float]
     metadata: Dict[str, Any] = field(default_factory=dict)
     flagged_for_review: bool = False
     
-    def __post_init__(self):
-        """Validate merged result data after initialization."""
-        self.validate()
-    
     def validate(self) -> None:
         """Validate all merged result fields."""
-        if not isinstance(self.contributing_models, list):
-            raise ValidationError("contributing_models must be a list")
+        if not isinstance(self.contributing_models, tuple):
+            raise ValidationError("contributing_models must be a tuple")
         for score in self.confidence_scores.values():
-            validate_confidence_score(score, "confidence_score")
+            # Only out-of-the-ordinary values pay for the full validator
+            if score.__class__ is not float or not 0.0 <= score <= 1.0:
+                validate_confidence_score(score, "confidence_score")
+    
+    def __post_init__(self):
+        """Store contributing_models as a tuple, then validate."""
+        if self.contributing_models.__class__ is not tuple:
+            self.contributing_models = tuple(self.contributing_models)
+        self.validate()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "data": self.data,
-            "contributing_models": self.contributing_models,
+            "contributing_models": list(self.contributing_models),
             "confidence_scores": self.confidence_scores,
             "metadata": self.metadata,
             "flagged_for_review": self.flagged_for_review
         }
 
 
+@with_slots
 @dataclass
 class ValidationResult:
     """Result of data validation."""
@@ -297,6 +565,7 @@ class ValidationResult:
         }
 
 
+@with_slots
 @dataclass
 class ConfidenceScore:
     """Represents a confidence score for a model-task combination."""
@@ -304,11 +573,18 @@ class ConfidenceScore:
     task_type: TaskType
     score: float
     sample_count: int = 0
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated: datetime = field(default_factory=coarse_now)
+    # Running EWMA state over performance records (newest weight 1.0)
+    ewma_samples: int = 0
+    ewma_weight_sum: float = 0.0
+    ewma_correct_sum: float = 0.0
+    storage_key: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate confidence score data after initialization."""
         self.validate()
+        # Key used in the persisted scores file, computed once per score
+        self.storage_key = f"{self.model_name}_{self.task_type._value_}"
     
     def validate(self) -> None:
         """Validate all confidence score fields."""
@@ -319,14 +595,44 @@ class ConfidenceScore:
         if not isinstance(self.sample_count, int) or self.sample_count < 0:
             raise ValidationError(f"sample_count must be a non-negative integer, got {self.sample_count}")
     
+    def updated(
+        self,
+        score: float,
+        sample_count: int,
+        last_updated: datetime,
+    ) -> 'ConfidenceScore':
+        """
+        Copy with a new score, sample count and timestamp.
+        
+        For internal updates of an already validated score: the copy skips
+        __init__/validate() and only range-checks the new score, unlike
+        ``dataclasses.replace``.
+        """
+        if not 0.0 <= score <= 1.0:
+            validate_confidence_score(score, "score")
+        clone = object.__new__(ConfidenceScore)
+        clone.model_name = self.model_name
+        clone.task_type = self.task_type
+        clone.score = score
+        clone.sample_count = sample_count
+        clone.last_updated = last_updated
+        clone.ewma_samples = self.ewma_samples
+        clone.ewma_weight_sum = self.ewma_weight_sum
+        clone.ewma_correct_sum = self.ewma_correct_sum
+        clone.storage_key = self.storage_key
+        return clone
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "model_name": self.model_name,
-            "task_type": self.task_type.value,
+            "task_type": self.task_type._value_,
             "score": self.score,
             "sample_count": self.sample_count,
-            "last_updated": self.last_updated.isoformat()
+            "last_updated": _isoformat(self.last_updated),
+            "ewma_samples": self.ewma_samples,
+            "ewma_weight_sum": self.ewma_weight_sum,
+            "ewma_correct_sum": self.ewma_correct_sum,
         }
     
     @classmethod
@@ -334,10 +640,13 @@ class ConfidenceScore:
         """Create from dictionary."""
         return cls(
             model_name=data["model_name"],
-            task_type=TaskType(data["task_type"]),
+            task_type=_task_type_from_value(data["task_type"]),
             score=data["score"],
             sample_count=data.get("sample_count", 0),
-            last_updated=datetime.fromisoformat(data["last_updated"]) if "last_updated" in data else datetime.now()
+            last_updated=parse_isoformat(data["last_updated"]) if "last_updated" in data else datetime.now(),
+            ewma_samples=data.get("ewma_samples", 0),
+            ewma_weight_sum=data.get("ewma_weight_sum", 0.0),
+            ewma_correct_sum=data.get("ewma_correct_sum", 0.0),
         )
 
 
@@ -349,6 +658,7 @@ class RoutingStrategy(Enum):
     ADAPTIVE = "adaptive"  # Dynamically decide based on confidence
 
 
+@with_slots
 @dataclass
 class MetricsSummary:
     """Aggregated metrics summary for performance reporting."""
@@ -3,21 +3,91 @@ Main AI Orchestrator - coordinates all components for intelligent AI collaborati
 """
 
 import asyncio
+import itertools
+import json
 import logging
-import uuid
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from enum import Enum
+from functools import partial
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .config import OrchestratorConfig
-from .models import Request, Response, TaskType, AIModel, MergedResult
+from .models import Request, Response, TaskType, AIModel, MergedResult, new_request_id
 from .storage import StorageManager
 from .learning_engine import LearningEngine
 from .task_classifier import TaskClassifier
 from .cache import ResponseCache, create_cache
+from .parallel_executor import start_task
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# Shared by all orchestrators in the process, so counter-based request IDs
+# stay unique across instances created in the same second
+_REQUEST_IDS = itertools.count()
+
+# Estimated cost of a ~1K token request, precomputed on each AIModel
+_REQUEST_COST = attrgetter("cost_per_request")
+
+
+def _report_default(value: Any) -> Any:
+    """Encode a report value JSON has no type for: enums by value, else str()."""
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _report_key(key: Any) -> Any:
+    """Encode a non-string report key the way orjson's OPT_NON_STR_KEYS does."""
+    if isinstance(key, Enum):
+        return key.value
+    if isinstance(key, datetime):
+        return key.isoformat()
+    return key
+
+
+def _plain_report(value: Any) -> Any:
+    """Prepare a report for json.dumps: convert keys, NaN/inf become null."""
+    if isinstance(value, dict):
+        return {_report_key(k): _plain_report(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain_report(v) for v in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _dump_report(report: Dict[str, Any]) -> bytes:
+    """
+    Indented UTF-8 JSON for a report, the same with or without orjson.
+    
+    Datetimes and dataclasses go through str() on both paths, enums are
+    written by value, and non-finite floats become null.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            default=_report_default,
+            option=(
+                orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            ),
+        )
+    return json.dumps(
+        _plain_report(report), indent=2, default=_report_default, ensure_ascii=False
+    ).encode('utf-8')
+
 
 class AIOrchestrator:
     """
@@ -27,12 +97,16 @@ class AIOrchestrator:
     Merging → Feedback → Learning
     """
     
+    # Cache writes allowed in flight; further writes are dropped
+    MAX_PENDING_CACHE_WRITES = 256
+    
     def __init__(
         self,
         config: Optional[OrchestratorConfig] = None,
         enable_cache: bool = True,
         cache_max_size: int = 1000,
-        cache_ttl_seconds: float = 3600.0
+        cache_ttl_seconds: float = 3600.0,
+        cache_policy: str = "vlru"
     ):
         self.config = config or OrchestratorConfig()
 
@@ -44,20 +118,65 @@ class AIOrchestrator:
         )
 
         # Initialize cache
-        self.enable_cache = enable_cache
         self._cache: Optional[ResponseCache] = None
         if enable_cache:
+            # "vlru" keeps results that were costly to produce or are reused
+            # over one-shot ones; "lru" evicts by recency alone
             self._cache = create_cache(
-                cache_type="lru",
+                cache_type=cache_policy,
                 max_size=cache_max_size,
-                ttl_seconds=cache_ttl_seconds
+                ttl_seconds=cache_ttl_seconds,
+                cost_of=self._regeneration_cost
             )
+        # Cache consulted by process_request: None while caching is disabled
+        # or no cache exists, so the hot path tests a single attribute
+        self._active_cache: Optional[ResponseCache] = None
+        self.enable_cache = enable_cache
 
         # Available AI models (will be populated by adapters)
         self.models: Dict[str, AIModel] = {}
+        # (name, model) snapshot of self.models, rebuilt on registration;
+        # ranking iterates it instead of walking the dict
+        self._model_items: Tuple[Tuple[str, AIModel], ...] = ()
+
+        # Per task type: (learning engine score_version, models ranked by
+        # confidence, model name -> confidence); rebuilt when scores change
+        self._rankings: Dict[
+            TaskType, Tuple[int, List[Tuple[AIModel, float]], Dict[str, float]]
+        ] = {}
+
+        # Counter-based request IDs: "<pid><start time><random>-<n>" in hex.
+        # The random bytes are read once, so containers that all run as pid 1
+        # and start in the same second still get distinct prefixes
+        self._request_id_prefix = (
+            f"{os.getpid():x}{int(time.time()):x}{os.urandom(4).hex()}"
+        )
+
+        # Background cache writes started by process_request
+        self._pending_cache_writes: Set[asyncio.Task] = set()
+
+        # Feedback recorded through record_feedback_async runs on a single
+        # worker thread; the lock serializes learning engine updates with the
+        # synchronous record_feedback, and the counter lets a burst of queued
+        # feedback recalculate scores once
+        self._feedback_pool: Optional[ThreadPoolExecutor] = None
+        self._feedback_lock = threading.Lock()
+        # Sequence number of the last feedback handed to the worker; only
+        # written on the event loop thread, so it needs no lock
+        self._feedback_seq = 0
 
         logger.info(f"AI Orchestrator initialized (cache: {enable_cache})")
     
+    @property
+    def enable_cache(self) -> bool:
+        """Whether process_request reads and writes the response cache."""
+        return self._enable_cache
+    
+    @enable_cache.setter
+    def enable_cache(self, value: bool) -> None:
+        self._enable_cache = value
+        self._active_cache = self._cache if value else None
+    
     def register_model(self, model: AIModel) -> None:
         """
         Register an AI model with the orchestrator.
@@ -66,6 +185,8 @@ class AIOrchestrator:
             model: AIModel instance to register
         """
         self.models[model.name] = model
+        self._model_items = tuple(self.models.items())
+        self._rankings.clear()
         logger.info(f"Registered AI model: {model.name} ({model.provider})")
     
     async def process_request(
@@ -95,8 +216,9 @@ class AIOrchestrator:
         cost = cost_limit or self.config.default_cost_limit
 
         # Check cache first
-        if use_cache and self._cache and self.enable_cache:
-            cached_result = await self._cache.get(
+        cache = self._active_cache if use_cache else None
+        if cache is not None:
+            cached_result = await cache.aget(
                 prompt=prompt,
                 quality_threshold=quality,
                 cost_limit=cost
@@ -108,7 +230,7 @@ class AIOrchestrator:
 
         # Create request object
         request = Request(
-            id=str(uuid.uuid4()),
+            id=self._next_request_id(),
             prompt=prompt,
             context=context or {},
             quality_threshold=quality,
@@ -127,13 +249,16 @@ class AIOrchestrator:
             logger.error("No models selected for request")
             return MergedResult(
                 data=None,
-                contributing_models=[],
+                contributing_models=(),
                 confidence_scores={},
                 metadata={"error": "No models available"},
                 flagged_for_review=True
             )
 
-        logger.info(f"Selected models: {[m.name for m in selected_models]}")
+        model_names = tuple(m.name for m in selected_models)
+        task_value = task_type._value_
+        logger.info(f"Selected models: {list(model_names)}")
+        _, model_confidence = self._rank_models(task_type)
 
         # Step 3: Execute models in parallel
         if model_call_func:
@@ -144,33 +269,41 @@ class AIOrchestrator:
             result_data = self._merge_responses(responses)
         else:
             # No model call function - return placeholder
-            result_data = {"status": "processed", "task_type": task_type.value}
+            result_data = {"status": "processed", "task_type": task_value}
 
+        # Positional arguments: data, contributing_models, confidence_scores,
+        # metadata (built once per request, so skip keyword matching)
         result = MergedResult(
-            data=result_data,
-            contributing_models=[m.name for m in selected_models],
-            confidence_scores={
-                m.name: self.learning_engine.get_confidence_score(m.name, task_type)
-                for m in selected_models
-            },
-            metadata={
+            result_data,
+            model_names,
+            {name: model_confidence[name] for name in model_names},
+            {
                 "request_id": request.id,
-                "task_type": task_type.value,
+                "task_type": task_value,
                 "classification_confidence": self.task_classifier.get_confidence(),
                 "cache_hit": False
             }
         )
 
-        # Cache the result
-        if use_cache and self._cache and self.enable_cache:
-            await self._cache.set(
-                prompt=prompt,
-                value=result,
-                task_type=task_type.value,
-                quality_threshold=quality,
-                cost_limit=cost,
-                models_used=[m.name for m in selected_models]
-            )
+        # Cache the result in the background; the caller needn't wait for it
+        if cache is not None:
+            if len(self._pending_cache_writes) < self.MAX_PENDING_CACHE_WRITES:
+                task = start_task(
+                    cache.aset(
+                        prompt=prompt,
+                        value=result,
+                        task_type=task_value,
+                        quality_threshold=quality,
+                        cost_limit=cost,
+                        models_used=list(model_names)
+                    ),
+                    self.config.eager_tasks,
+                )
+                if not task.done():
+                    self._pending_cache_writes.add(task)
+                task.add_done_callback(self._cache_write_done)
+            else:
+                logger.warning("Too many pending cache writes, not caching result")
 
         logger.info(f"Request {request.id} processed successfully")
 
@@ -184,21 +317,33 @@ class AIOrchestrator:
     ) -> List[Response]:
         """Execute model calls in parallel."""
         tasks = [
-            model_call_func(model, request)
+            start_task(model_call_func(model, request), self.config.eager_tasks)
             for model in models
         ]
         responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Filter out exceptions
-        valid_responses = []
-        for resp in responses:
-            if isinstance(resp, Response):
-                valid_responses.append(resp)
-            elif isinstance(resp, Exception):
-                logger.error(f"Model call failed: {resp}")
+        # Filter out exceptions; only a call that failed costs a second pass
+        valid_responses = [resp for resp in responses if isinstance(resp, Response)]
+        if len(valid_responses) != len(responses) and logger.isEnabledFor(logging.ERROR):
+            for resp in responses:
+                if isinstance(resp, Exception):
+                    logger.error(f"Model call failed: {resp}")
 
         return valid_responses
 
+    def _regeneration_cost(self, model_names: List[str]) -> float:
+        """Summed cost per 1M tokens of the models that produced a result."""
+        models = self.models
+        return sum(
+            models[name].cost_per_1m_tokens for name in model_names if name in models
+        )
+    
+    def _next_request_id(self) -> str:
+        """ID for a new request (UUID4 if config.use_uuid_request_ids)."""
+        if self.config.use_uuid_request_ids:
+            return new_request_id()
+        return f"{self._request_id_prefix}-{next(_REQUEST_IDS):x}"
+    
     def _merge_responses(self, responses: List[Response]) -> Any:
         """Merge multiple model responses."""
         if not responses:
@@ -206,13 +351,13 @@ class AIOrchestrator:
         if len(responses) == 1:
             return responses[0].content
 
-        # Simple merge: return first successful response
+        # Simple merge: return first successful response, else the first one
         # More sophisticated merging is handled by the Merger component
         for resp in responses:
             if resp.success:
                 return resp.content
 
-        return responses[0].content if responses else None
+        return responses[0].content
     
     def _select_models(
         self,
@@ -229,18 +374,12 @@ class AIOrchestrator:
         Returns:
             List of selected AI models
         """
-        if not self.models:
+        if not self._model_items:
             logger.warning("No models registered")
             return []
         
-        # Get confidence scores for all models for this task type
-        model_scores = []
-        for model_name, model in self.models.items():
-            confidence = self.learning_engine.get_confidence_score(model_name, task_type)
-            model_scores.append((model, confidence))
-        
-        # Sort by confidence (descending)
-        model_scores.sort(key=lambda x: x[1], reverse=True)
+        # Models with their confidence for this task type, best first
+        model_scores, _ = self._rank_models(task_type)
         
         # Determine how many models to use based on task type
         if task_type == TaskType.SIMPLE_QUERY:
@@ -254,7 +393,7 @@ class AIOrchestrator:
         
         # If classification confidence is low, use more models
         if self.task_classifier.is_low_confidence():
-            count = min(count + 1, len(self.models))
+            count = min(count + 1, len(self._model_items))
             logger.info(f"Low classification confidence, increasing model count to {count}")
         
         # Select top N models that meet quality threshold
@@ -272,6 +411,39 @@ class AIOrchestrator:
         
         return selected
     
+    def _rank_models(
+        self,
+        task_type: TaskType
+    ) -> Tuple[List[Tuple[AIModel, float]], Dict[str, float]]:
+        """
+        Registered models ranked by confidence for a task type.
+        
+        Cached until the learning engine's scores or the registered models
+        change, so requests don't re-query every score.
+        
+        Args:
+            task_type: The classified task type
+            
+        Returns:
+            (model, confidence) pairs sorted descending, and the confidence
+            per model name
+        """
+        version = self.learning_engine.score_version
+        cached = self._rankings.get(task_type)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        
+        # One fetch of the task's score row instead of a lookup per model
+        get_score = self.learning_engine.get_all_scores_for_task(task_type).get
+        default = self.learning_engine.DEFAULT_CONFIDENCE
+        ranked = [
+            (model, get_score(name, default)) for name, model in self._model_items
+        ]
+        ranked.sort(key=itemgetter(1), reverse=True)
+        confidence = {model.name: score for model, score in ranked}
+        self._rankings[task_type] = (version, ranked, confidence)
+        return ranked, confidence
+    
     def _apply_cost_limit(
         self,
         models: List[AIModel],
@@ -288,13 +460,13 @@ class AIOrchestrator:
             Filtered list of models
         """
         # Sort by cost (ascending)
-        sorted_models = sorted(models, key=lambda m: m.cost_per_1m_tokens)
+        sorted_models = sorted(models, key=_REQUEST_COST)
         
         selected = []
         total_cost = 0.0
         
         for model in sorted_models:
-            estimated_cost = model.cost_per_1m_tokens * 0.001  # Estimate for 1K tokens
+            estimated_cost = model.cost_per_request  # Estimate for 1K tokens
             if total_cost + estimated_cost <= cost_limit:
                 selected.append(model)
                 total_cost += estimated_cost
@@ -328,16 +500,88 @@ class AIOrchestrator:
             response_time: Time taken (seconds)
             cost: Cost incurred (USD)
         """
-        self.learning_engine.record_performance(
-            model_name=model_name,
-            task_type=task_type,
-            was_correct=was_correct,
-            response_time=response_time,
-            cost=cost
-        )
+        with self._feedback_lock:
+            self.learning_engine.record_performance(
+                model_name=model_name,
+                task_type=task_type,
+                was_correct=was_correct,
+                response_time=response_time,
+                cost=cost
+            )
+            
+            # Trigger confidence score update
+            self.learning_engine.update_confidence_scores()
+        
+        logger.info(f"Recorded feedback for {model_name} on {task_type.value}: correct={was_correct}")
+    
+    async def record_feedback_async(
+        self,
+        request_id: str,
+        model_name: str,
+        task_type: TaskType,
+        was_correct: bool,
+        response_time: float = 0.0,
+        cost: float = 0.0
+    ) -> None:
+        """
+        Record feedback without blocking the event loop.
         
-        # Trigger confidence score update
-        self.learning_engine.update_confidence_scores()
+        The learning engine work runs on a single worker thread, so feedback
+        is applied in order. During a burst, confidence scores are
+        recalculated once, after the last queued feedback, rather than per
+        call. Takes the same arguments as record_feedback.
+        """
+        if self._feedback_pool is None:
+            self._feedback_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="orchestrator-feedback"
+            )
+        # The loop never takes _feedback_lock: the worker holds it for the
+        # whole learning engine update, which would stall the loop
+        self._feedback_seq += 1
+        seq = self._feedback_seq
+        # run_in_executor rather than asyncio.to_thread: the learning engine
+        # doesn't use context variables, so copying the context is wasted work
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._feedback_pool,
+                partial(
+                    self._record_queued_feedback,
+                    seq, model_name, task_type, was_correct, response_time, cost,
+                ),
+            )
+        except BaseException:
+            # Never queued (e.g. the pool was shut down)
+            if self._feedback_seq == seq:
+                self._feedback_seq = seq - 1
+            raise
+        await future
+    
+    def _record_queued_feedback(
+        self,
+        seq: int,
+        model_name: str,
+        task_type: TaskType,
+        was_correct: bool,
+        response_time: float,
+        cost: float
+    ) -> None:
+        """Worker side of record_feedback_async (``seq`` orders the burst)."""
+        with self._feedback_lock:
+            try:
+                self.learning_engine.record_performance(
+                    model_name=model_name,
+                    task_type=task_type,
+                    was_correct=was_correct,
+                    response_time=response_time,
+                    cost=cost
+                )
+            finally:
+                # Even when this record was rejected, the burst must still
+                # end in a score update. The worker runs jobs in order, so a
+                # newer sequence number means a later job will do it
+                if seq == self._feedback_seq:
+                    # Last of the burst; earlier ones left the update to it
+                    self.learning_engine.update_confidence_scores()
         
         logger.info(f"Recorded feedback for {model_name} on {task_type.value}: correct={was_correct}")
     
@@ -374,14 +618,8 @@ class AIOrchestrator:
         if task_type:
             return self.learning_engine.get_all_scores_for_task(task_type)
         else:
-            # Return all scores
-            all_scores = {}
-            for task_t in TaskType:
-                scores = self.learning_engine.get_all_scores_for_task(task_t)
-                for model_name, score in scores.items():
-                    key = f"{model_name}_{task_t.value}"
-                    all_scores[key] = score
-            return all_scores
+            # Return all scores, keyed "<model>_<task_type>"
+            return self.learning_engine.get_scores_by_storage_key()
 
     # Cache management methods
 
@@ -417,14 +655,48 @@ class AIOrchestrator:
             return 0
 
         if prompt:
-            removed = await self._cache.invalidate(prompt)
+            removed = self._cache.invalidate(prompt)
             return 1 if removed else 0
         elif task_type:
-            return await self._cache.invalidate_by_task_type(task_type)
+            return self._cache.invalidate_by_task_type(task_type)
         elif model_name:
-            return await self._cache.invalidate_by_model(model_name)
+            return self._cache.invalidate_by_model(model_name)
         else:
-            return await self._cache.clear()
+            return self._cache.clear()
+
+    def _cache_write_done(self, task: asyncio.Task) -> None:
+        """Forget a finished background cache write, logging any failure."""
+        self._pending_cache_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background cache write failed: {task.exception()}")
+
+    async def drain_cache(self) -> None:
+        """Wait for background cache writes to finish (e.g. before shutdown)."""
+        while self._pending_cache_writes:
+            await asyncio.gather(
+                *self._pending_cache_writes, return_exceptions=True
+            )
+
+    async def close(self) -> None:
+        """
+        Release background resources and persist learned state.
+        
+        Waits for background cache writes and queued feedback, stops the
+        feedback worker thread and flushes pending confidence scores.
+        """
+        await self.drain_cache()
+        pool, self._feedback_pool = self._feedback_pool, None
+        if pool is not None:
+            # Joining the worker waits for queued feedback; keep the loop free
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        # Flush under the feedback lock, off the loop: record_feedback may
+        # still be updating scores from another thread
+        await asyncio.get_running_loop().run_in_executor(None, self._flush_learning)
+
+    def _flush_learning(self) -> None:
+        """Persist pending confidence scores, serialized with feedback updates."""
+        with self._feedback_lock:
+            self.learning_engine.flush()
 
     async def clear_cache(self) -> int:
         """
@@ -434,7 +706,7 @@ class AIOrchestrator:
             Number of entries cleared
         """
         if self._cache:
-            return await self._cache.clear()
+            return self._cache.clear()
         return 0
 
     def generate_performance_report(self, output_format: str = 'text') -> Any:
@@ -460,21 +732,21 @@ class AIOrchestrator:
         perf_report = self.learning_engine.get_performance_report()
         if perf_report:
             # Convert PerformanceReport to dict if needed
-            if hasattr(perf_report, '__dict__'):
+            if isinstance(perf_report, dict):
+                report_data.update(perf_report)
+            else:
                 report_data["total_requests"] = getattr(perf_report, 'total_requests', 0)
                 report_data["success_rate"] = getattr(perf_report, 'accuracy', 0) * 100
                 report_data["avg_response_time"] = getattr(perf_report, 'avg_response_time', 0)
                 report_data["avg_cost"] = getattr(perf_report, 'avg_cost', 0)
-            elif isinstance(perf_report, dict):
-                report_data.update(perf_report)
 
         if output_format == 'dict':
             return report_data
         elif output_format == 'json':
-            import json
-            return json.dumps(report_data, indent=2, default=str)
+            return _dump_report(report_data).decode('utf-8')
         else:
             # Text format
+            cache_stats = report_data['cache_stats']
             lines = [
                 "=" * 50,
                 "AI Orchestrator Performance Report",
@@ -485,9 +757,9 @@ class AIOrchestrator:
                 f"Avg Cost: ${report_data.get('avg_cost', 0):.4f}",
                 "",
                 "Cache Statistics:",
-                f"  Hits: {report_data['cache_stats'].get('hits', 0)}",
-                f"  Misses: {report_data['cache_stats'].get('misses', 0)}",
-                f"  Hit Rate: {report_data['cache_stats'].get('hit_rate', '0%')}",
+                f"  Hits: {cache_stats.get('hits', 0)}",
+                f"  Misses: {cache_stats.get('misses', 0)}",
+                f"  Hit Rate: {cache_stats.get('hit_rate', '0%')}",
                 "=" * 50
             ]
             return "\n".join(lines)
@@ -499,7 +771,6 @@ class AIOrchestrator:
         Args:
             filepath: Path to export file
         """
-        import json
         report = self.generate_performance_report(output_format='dict')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        with open(filepath, 'wb') as f:
+            f.write(_dump_report(report))
@@ -6,18 +6,68 @@ including response times, costs, accuracy, and anomaly detection.
 """
 
 import logging
-import statistics
-import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
-from .models import TaskType, PerformanceRecord, MetricsSummary
+from .models import TaskType, MetricsSummary, coarse_now, new_request_id
 from .storage import StorageManager
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 logger = logging.getLogger(__name__)
 
+_was_correct = attrgetter("was_correct")
+_response_time = attrgetter("response_time")
+_cost = attrgetter("cost")
+
+
+def _summarize(response_times, costs, correct) -> Tuple[int, float, float, float, float, float]:
+    """
+    Fused metrics kernel over NumPy columns.
+    
+    Returns (correct_count, total_response_time, total_cost, p50, p95, p99)
+    from one pass for the sums plus one sort for the percentiles (linear
+    interpolation, matching PerformanceTracker._percentile). Only used when
+    Numba is available to compile it.
+    """
+    n = len(response_times)
+    ok = 0
+    total_time = 0.0
+    total_cost = 0.0
+    for i in range(n):
+        ok += correct[i]
+        total_time += response_times[i]
+        total_cost += costs[i]
+    
+    ordered = np.sort(response_times)
+    result = np.empty(3)
+    for j, pct in enumerate((50.0, 95.0, 99.0)):
+        index = (n - 1) * pct / 100.0
+        lower = int(index)
+        if lower + 1 >= n:
+            result[j] = ordered[n - 1]
+        else:
+            weight = index - lower
+            result[j] = ordered[lower] * (1.0 - weight) + ordered[lower + 1] * weight
+    return ok, total_time, total_cost, result[0], result[1], result[2]
+
+
+if numba is not None and np is not None:
+    _summarize = numba.njit(cache=True)(_summarize)
+else:
+    _summarize = None
+
 
 @dataclass
 class RequestMetrics:
@@ -54,7 +104,7 @@ class ModelResponseMetrics:
     token_count: int
     cost: float
     success: bool
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=coarse_now)
     error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -94,7 +144,7 @@ class PerformanceTracker:
     
     def generate_request_id(self) -> str:
         """Generate a unique request ID."""
-        return str(uuid.uuid4())
+        return new_request_id()
     
     def start_request(
         self,
@@ -241,20 +291,22 @@ class PerformanceTracker:
         # Get recent performance history
         history = self.storage.query_performance_history(limit=10000)
         
-        # Group by model and task type
-        grouped: Dict[Tuple[str, TaskType], List[PerformanceRecord]] = {}
+        # Accumulate [sample_count, total_response_time] per model and task
+        # type in one pass, without building per-group record lists
+        grouped: Dict[Tuple[str, TaskType], List[float]] = {}
         for record in history:
             key = (record.model_name, record.task_type)
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(record)
+            state = grouped.get(key)
+            if state is None:
+                state = grouped[key] = [0, 0.0]
+            state[0] += 1
+            state[1] += record.response_time
         
         # Calculate baselines
-        for key, records in grouped.items():
-            response_times = [r.response_time for r in records]
+        for key, (count, total_time) in grouped.items():
             self._model_baselines[key] = {
-                "avg_response_time": statistics.mean(response_times) if response_times else 0,
-                "sample_count": len(records),
+                "avg_response_time": total_time / count,
+                "sample_count": count,
             }
         
         logger.info(f"Updated baselines for {len(grouped)} model-task combinations")
@@ -276,20 +328,19 @@ class PerformanceTracker:
         Returns:
             MetricsSummary with aggregated metrics
         """
-        # Query history
-        history = self.storage.query_performance_history(
-            model_name=model_name,
-            task_type=task_type,
-            limit=10000,
-        )
-        
-        # Apply time range filter
         time_range_start = None
         time_range_end = datetime.now()
         
         if time_range_days:
             time_range_start = time_range_end - timedelta(days=time_range_days)
-            history = [r for r in history if r.timestamp >= time_range_start]
+        
+        # Query history (time range applied while reading)
+        history = self.storage.query_performance_history(
+            model_name=model_name,
+            task_type=task_type,
+            limit=10000,
+            start_time=time_range_start,
+        )
         
         if not history:
             return MetricsSummary(
@@ -306,21 +357,48 @@ class PerformanceTracker:
                 time_range_end=time_range_end,
             )
         
-        # Calculate metrics
+        # Calculate metrics over columns extracted once from the records
         total = len(history)
-        correct = sum(1 for r in history if r.was_correct)
-        response_times = sorted([r.response_time for r in history])
-        costs = [r.cost for r in history]
+        if _summarize is not None:
+            correct, total_time, total_cost, p50, p95, p99 = _summarize(
+                np.fromiter(map(_response_time, history), dtype=np.float64, count=total),
+                np.fromiter(map(_cost, history), dtype=np.float64, count=total),
+                np.fromiter(map(_was_correct, history), dtype=np.uint8, count=total),
+            )
+            avg_response_time = total_time / total
+        elif np is not None:
+            correct = int(np.count_nonzero(
+                np.fromiter(map(_was_correct, history), dtype=np.bool_, count=total)
+            ))
+            response_times = np.fromiter(
+                map(_response_time, history), dtype=np.float64, count=total
+            )
+            total_cost = float(
+                np.fromiter(map(_cost, history), dtype=np.float64, count=total).sum()
+            )
+            avg_response_time = float(response_times.mean())
+            # Linear interpolation, matching _percentile
+            p50, p95, p99 = (
+                float(p) for p in np.percentile(response_times, [50, 95, 99])
+            )
+        else:
+            correct = sum(map(_was_correct, history))
+            response_times = sorted(map(_response_time, history))
+            total_cost = sum(map(_cost, history))
+            avg_response_time = sum(response_times) / total
+            p50 = self._percentile(response_times, 50)
+            p95 = self._percentile(response_times, 95)
+            p99 = self._percentile(response_times, 99)
         
         return MetricsSummary(
             total_requests=total,
             accuracy=correct / total,
-            avg_response_time=statistics.mean(response_times),
-            p50_response_time=self._percentile(response_times, 50),
-            p95_response_time=self._percentile(response_times, 95),
-            p99_response_time=self._percentile(response_times, 99),
-            total_cost=sum(costs),
-            avg_cost=statistics.mean(costs),
+            avg_response_time=avg_response_time,
+            p50_response_time=p50,
+            p95_response_time=p95,
+            p99_response_time=p99,
+            total_cost=total_cost,
+            avg_cost=total_cost / total,
             success_rate=correct / total,
             time_range_start=time_range_start,
             time_range_end=time_range_end,
@@ -356,35 +434,35 @@ class PerformanceTracker:
         Returns:
             Dictionary mapping model names to their metrics
         """
+        # Query history (time filter applied while reading)
+        cutoff = datetime.now() - timedelta(days=time_range_days)
         history = self.storage.query_performance_history(
             task_type=task_type,
             limit=10000,
+            start_time=cutoff,
         )
         
-        # Apply time filter
-        cutoff = datetime.now() - timedelta(days=time_range_days)
-        history = [r for r in history if r.timestamp >= cutoff]
-        
-        # Group by model
-        by_model: Dict[str, List[PerformanceRecord]] = {}
+        # Accumulate [count, correct, total_response_time, total_cost] per
+        # model in one pass
+        by_model: Dict[str, List[float]] = {}
         for record in history:
-            if record.model_name not in by_model:
-                by_model[record.model_name] = []
-            by_model[record.model_name].append(record)
+            state = by_model.get(record.model_name)
+            if state is None:
+                state = by_model[record.model_name] = [0, 0, 0.0, 0.0]
+            state[0] += 1
+            state[1] += record.was_correct
+            state[2] += record.response_time
+            state[3] += record.cost
         
         # Calculate metrics per model
         comparison = {}
-        for model_name, records in by_model.items():
-            response_times = [r.response_time for r in records]
-            costs = [r.cost for r in records]
-            correct = sum(1 for r in records if r.was_correct)
-            
+        for model_name, (count, correct, total_time, total_cost) in by_model.items():
             comparison[model_name] = {
-                "total_requests": len(records),
-                "accuracy": correct / len(records) if records else 0,
-                "avg_response_time": statistics.mean(response_times) if response_times else 0,
-                "avg_cost": statistics.mean(costs) if costs else 0,
-                "total_cost": sum(costs),
+                "total_requests": count,
+                "accuracy": correct / count,
+                "avg_response_time": total_time / count,
+                "avg_cost": total_cost / count,
+                "total_cost": total_cost,
             }
         
         return comparison
@@ -8,19 +8,53 @@ including confidence scores (JSON) and performance history (JSONL).
 import json
 import os
 import shutil
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 import threading
 
-from .models import AIModel, TaskType, PerformanceRecord, ConfidenceScore
+from .models import AIModel, TaskType, PerformanceRecord, ConfidenceScore, TASK_TYPE_KEY_SUFFIXES, parse_isoformat
 from .config import OrchestratorConfig
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_records(records: List[PerformanceRecord]) -> bytes:
+    """Encode records as JSONL bytes."""
+    return b''.join(r.to_json() + b'\n' for r in records)
+
+
+def _bisect_timestamp(
+    records: List[PerformanceRecord],
+    when: datetime,
+    right: bool = False
+) -> int:
+    """
+    Binary-search time-ordered records for a timestamp.
+    
+    Returns the index of the first record at or after ``when`` (or strictly
+    after it when ``right`` is set), like ``bisect_left``/``bisect_right``.
+    """
+    lo, hi = 0, len(records)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ts = records[mid].timestamp
+        if ts < when or (right and ts == when):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 class StorageError(Exception):
     """Raised when a storage operation fails."""
     pass
@@ -41,6 +75,11 @@ class StorageManager:
         self._use_memory_fallback = False
         self._memory_scores: Dict[Tuple[str, TaskType], float] = {}
         self._memory_records: List[PerformanceRecord] = []
+        # Whether _memory_records is in timestamp order, so ranges can bisect
+        self._memory_records_sorted = True
+        
+        # Serialized scores as last written/read, for row-level upserts
+        self._serialized_scores: Optional[Dict[str, Dict[str, Any]]] = None
         
         # Ensure storage directory exists
         os.makedirs(config.storage_dir, exist_ok=True)
@@ -113,22 +152,11 @@ class StorageManager:
                     return True
                 
                 # Convert to serializable format with full metadata
-                serializable_scores = {}
-                for score in scores:
-                    key = f"{score.model_name}_{score.task_type.value}"
-                    serializable_scores[key] = {
-                        "score": score.score,
-                        "sample_count": score.sample_count,
-                        "last_updated": score.last_updated.isoformat(),
-                    }
-                
-                data = {
-                    "version": "1.1",
-                    "last_updated": datetime.now().isoformat(),
-                    "scores": serializable_scores
+                serializable_scores = {
+                    score.storage_key: self._serialize_score(score)
+                    for score in scores
                 }
-                
-                self._write_json_atomic(self.confidence_scores_path, data)
+                self._write_scores_file(serializable_scores)
                 
                 logger.info(f"Saved {len(scores)} confidence scores to {self.confidence_scores_path}")
                 return True
@@ -138,6 +166,72 @@ class StorageManager:
                 self._use_memory_fallback = True
                 return False
     
+    def upsert_confidence_scores(
+        self,
+        scores: List[ConfidenceScore]
+    ) -> bool:
+        """
+        Insert or update only the given confidence scores.
+        
+        Scores not passed in keep their stored values. Only the changed rows
+        are re-serialized; the file itself is still rewritten atomically.
+        
+        Args:
+            scores: Changed ConfidenceScore objects
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._lock:
+            try:
+                for s in scores:
+                    self._memory_scores[(s.model_name, s.task_type)] = s.score
+                
+                if self._use_memory_fallback:
+                    logger.warning("Using memory fallback, scores not persisted to disk")
+                    return True
+                
+                serializable_scores = self._serialized_scores
+                if serializable_scores is None:
+                    serializable_scores = {}
+                    if os.path.exists(self.confidence_scores_path):
+                        with open(self.confidence_scores_path, 'r', encoding='utf-8') as f:
+                            serializable_scores = dict(json.load(f).get("scores", {}))
+                
+                for score in scores:
+                    serializable_scores[score.storage_key] = self._serialize_score(score)
+                self._write_scores_file(serializable_scores)
+                
+                logger.debug(f"Upserted {len(scores)} confidence scores")
+                return True
+                
+            except Exception as e:
+                logger.error(f"Failed to upsert confidence scores: {e}")
+                self._use_memory_fallback = True
+                return False
+    
+    @staticmethod
+    def _serialize_score(score: ConfidenceScore) -> Dict[str, Any]:
+        """Serializable form of a score, keyed by storage_key in the file."""
+        return {
+            "score": score.score,
+            "sample_count": score.sample_count,
+            "last_updated": score.last_updated.isoformat(),
+            "ewma_samples": score.ewma_samples,
+            "ewma_weight_sum": score.ewma_weight_sum,
+            "ewma_correct_sum": score.ewma_correct_sum,
+        }
+    
+    def _write_scores_file(self, serializable_scores: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the scores file (lock must be held)."""
+        data = {
+            "version": "1.1",
+            "last_updated": datetime.now().isoformat(),
+            "scores": serializable_scores
+        }
+        self._write_json_atomic(self.confidence_scores_path, data)
+        self._serialized_scores = serializable_scores
+    
     def load_confidence_scores(self) -> List[ConfidenceScore]:
         """
         Load confidence scores from storage.
@@ -164,12 +258,13 @@ class StorageManager:
                 
                 scores = []
                 version = data.get("version", "1.0")
+                raw_scores = data.get("scores", {})
+                self._serialized_scores = dict(raw_scores)
                 
-                for key, value in data.get("scores", {}).items():
+                for key, value in raw_scores.items():
                     # Try to find a valid TaskType suffix
                     parsed = False
-                    for task_type in TaskType:
-                        suffix = f"_{task_type.value}"
+                    for suffix, task_type in TASK_TYPE_KEY_SUFFIXES:
                         if key.endswith(suffix):
                             model_name = key[:-len(suffix)]
                             
@@ -180,7 +275,10 @@ class StorageManager:
                                     task_type=task_type,
                                     score=value["score"],
                                     sample_count=value.get("sample_count", 0),
-                                    last_updated=datetime.fromisoformat(value["last_updated"]) if "last_updated" in value else datetime.now(),
+                                    last_updated=parse_isoformat(value["last_updated"]) if "last_updated" in value else datetime.now(),
+                                    ewma_samples=value.get("ewma_samples", 0),
+                                    ewma_weight_sum=value.get("ewma_weight_sum", 0.0),
+                                    ewma_correct_sum=value.get("ewma_correct_sum", 0.0),
                                 )
                             else:
                                 # Old format: just a float
@@ -247,15 +345,14 @@ class StorageManager:
         with self._lock:
             try:
                 # Always add to memory cache
-                self._memory_records.append(record)
+                self._remember_records([record])
                 
                 if self._use_memory_fallback:
                     logger.warning("Using memory fallback, record not persisted to disk")
                     return True
                 
-                with open(self.performance_history_path, 'a', encoding='utf-8') as f:
-                    json.dump(record.to_dict(), f, ensure_ascii=False)
-                    f.write('\n')
+                with open(self.performance_history_path, 'ab') as f:
+                    f.write(_encode_records([record]))
                 
                 return True
                 
@@ -280,16 +377,14 @@ class StorageManager:
         with self._lock:
             try:
                 # Add to memory cache
-                self._memory_records.extend(records)
+                self._remember_records(records)
                 
                 if self._use_memory_fallback:
                     logger.warning("Using memory fallback, records not persisted to disk")
                     return True
                 
-                with open(self.performance_history_path, 'a', encoding='utf-8') as f:
-                    for record in records:
-                        json.dump(record.to_dict(), f, ensure_ascii=False)
-                        f.write('\n')
+                with open(self.performance_history_path, 'ab') as f:
+                    f.write(_encode_records(records))
                 
                 logger.info(f"Appended {len(records)} performance records")
                 return True
@@ -299,27 +394,56 @@ class StorageManager:
                 self._use_memory_fallback = True
                 return False
     
+    def _remember_records(self, records: List[PerformanceRecord]) -> None:
+        """Add records to the memory cache, noting if they break time order."""
+        if self._memory_records_sorted and records:
+            last = self._memory_records[-1].timestamp if self._memory_records else None
+            for record in records:
+                if last is not None and record.timestamp < last:
+                    self._memory_records_sorted = False
+                    break
+                last = record.timestamp
+        self._memory_records.extend(records)
+    
     def query_performance_history(
         self,
         model_name: Optional[str] = None,
         task_type: Optional[TaskType] = None,
         limit: int = 1000,
         start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None,
+        sort: Optional[str] = None
     ) -> List[PerformanceRecord]:
         """
         Query performance history with optional filters.
         
+        Records are kept in append order. By default the first ``limit``
+        matches are returned in that order; with
+        ``sort="timestamp_desc"`` the last ``limit`` matches are returned in
+        reverse append order, which is newest first when records were
+        appended in time order.
+        
         Args:
             model_name: Filter by model name (optional)
             task_type: Filter by task type (optional)
             limit: Maximum number of records to return
             start_time: Filter records after this time (optional)
             end_time: Filter records before this time (optional)
+            sort: None for append order, or "timestamp_desc"
             
         Returns:
             List of performance records matching the filters
         """
+        if sort not in (None, "timestamp_desc"):
+            raise ValueError(f"Unsupported sort order: {sort}")
+        newest_first = sort == "timestamp_desc"
+        
+        def take(records: List[PerformanceRecord]) -> List[PerformanceRecord]:
+            """Apply ordering and limit to records in append order."""
+            if newest_first:
+                return records[::-1][:limit]
+            return records[:limit]
+        
         def matches_filters(record: PerformanceRecord) -> bool:
             """Check if a record matches all filters."""
             if model_name and record.model_name != model_name:
@@ -332,27 +456,41 @@ class StorageManager:
                 return False
             return True
         
+        def query_memory() -> List[PerformanceRecord]:
+            """Query in-memory records, slicing the time range by bisection."""
+            records = self._memory_records
+            if not self._memory_records_sorted:
+                return take([r for r in records if matches_filters(r)])
+            lo = _bisect_timestamp(records, start_time) if start_time else 0
+            hi = _bisect_timestamp(records, end_time, right=True) if end_time else len(records)
+            if not model_name and not task_type:
+                return take(records[lo:hi])
+            return take([
+                r for r in records[lo:hi]
+                if (not model_name or r.model_name == model_name)
+                and (not task_type or r.task_type == task_type)
+            ])
+        
         with self._lock:
             # If using memory fallback, query from memory
             if self._use_memory_fallback or not os.path.exists(self.performance_history_path):
-                records = [r for r in self._memory_records if matches_filters(r)]
-                return records[:limit]
+                return query_memory()
             
             try:
-                records = []
+                # Newest-first keeps a sliding window of the last matches
+                records = deque(maxlen=limit) if newest_first else []
                 with open(self.performance_history_path, 'r', encoding='utf-8') as f:
                     for line in f:
                         if not line.strip():
                             continue
                         
                         try:
-                            data = json.loads(line)
-                            record = PerformanceRecord.from_dict(data)
+                            record = PerformanceRecord.from_json(line)
                             
                             if matches_filters(record):
                                 records.append(record)
                             
-                            if len(records) >= limit:
+                            if not newest_first and len(records) >= limit:
                                 break
                                 
                         except Exception as e:
@@ -360,12 +498,14 @@ class StorageManager:
                             continue
                 
                 logger.debug(f"Queried {len(records)} performance records")
+                if newest_first:
+                    return list(reversed(records))
                 return records
                 
             except Exception as e:
                 logger.error(f"Failed to query performance history: {e}")
                 self._use_memory_fallback = True
-                return [r for r in self._memory_records if matches_filters(r)][:limit]
+                return query_memory()
     
     def get_performance_summary(
         self,
@@ -433,8 +573,8 @@ class StorageManager:
                             continue
                         
                         try:
-                            data = json.loads(line)
-                            record_time = datetime.fromisoformat(data["timestamp"]).timestamp()
+                            data = _json_loads(line)
+                            record_time = parse_isoformat(data["timestamp"]).timestamp()
                             
                             if record_time >= cutoff_date:
                                 kept_records.append(line)
@@ -454,7 +594,15 @@ class StorageManager:
                 
                 # Also clean up memory cache
                 cutoff_datetime = datetime.fromtimestamp(cutoff_date)
-                self._memory_records = [r for r in self._memory_records if r.timestamp >= cutoff_datetime]
+                if self._memory_records_sorted:
+                    self._memory_records = self._memory_records[
+                        _bisect_timestamp(self._memory_records, cutoff_datetime):
+                    ]
+                else:
+                    self._memory_records = [
+                        r for r in self._memory_records
+                        if r.timestamp >= cutoff_datetime
+                    ]
                 
                 logger.info(f"Cleaned up {removed_count} old performance records")
                 return removed_count
@@ -0,0 +1,137 @@
+"""
+Test script for the response caches.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_orchestrator.cache import ResponseCache, ValueAwareCache
+
+
+def test_ttl_expiry_with_tick_clock():
+    """Entries expire on the cached tick clock, and after the loop is gone."""
+    print("=" * 60)
+    print("Cache TTL Test")
+    print("=" * 60)
+
+    cache = ResponseCache(max_size=10, default_ttl_seconds=60.0)
+
+    async def run():
+        await cache.start_cleanup_task()
+        assert cache._clock is not None
+        cache.set("short", "v", ttl_seconds=0.1)
+        cache.set("long", "v")
+        assert cache.get("short") == "v"
+        await asyncio.sleep(0.3)
+        assert cache.get("short") is None
+        assert cache.get("long") == "v"
+
+        # Left running on purpose: the loop closes without stop_cleanup_task()
+        cache.set("after", "v", ttl_seconds=0.1)
+
+    asyncio.run(run())
+    print("[OK] Entries expire on the tick clock")
+
+    time.sleep(0.2)
+    assert cache.get("after") is None
+    assert cache._clock is None
+    print("[OK] Clock falls back to time.monotonic() once the loop closes")
+
+
+def test_single_flight_with_cancellation():
+    """Concurrent misses share one computation, even if its owner is cancelled."""
+    print("=" * 60)
+    print("Cache Single-Flight Test")
+    print("=" * 60)
+
+    cache = ResponseCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def shared():
+        results = await asyncio.gather(*[cache.get_or_compute("p", compute) for _ in range(5)])
+        assert results == [1] * 5
+        assert await cache.get_or_compute("p", compute) == 1
+        assert len(calls) == 1
+
+    asyncio.run(shared())
+    print("[OK] Concurrent misses compute once")
+
+    calls.clear()
+
+    async def owner_cancelled():
+        owner = asyncio.ensure_future(cache.get_or_compute("q", compute))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(cache.get_or_compute("q", compute)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        results = await asyncio.gather(*waiters)
+        assert owner.cancelled()
+        # One waiter took over; the others shared its result
+        assert results == [2, 2, 2]
+        assert len(calls) == 2
+        assert not cache._inflight
+
+    asyncio.run(owner_cancelled())
+    print("[OK] Waiters retry when the owner is cancelled")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("model error")
+
+    async def errors():
+        results = await asyncio.gather(
+            *[cache.get_or_compute("r", failing) for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert cache.get("r") is None
+
+    asyncio.run(errors())
+    print("[OK] Errors reach every waiter and are not cached")
+
+
+def test_value_aware_eviction():
+    """v-LRU evicts the cheapest, least used of the oldest entries."""
+    print("=" * 60)
+    print("Value-Aware Cache Test")
+    print("=" * 60)
+
+    costs = {"expensive": 5.0, "cheap": 0.0}
+    cache = ValueAwareCache(max_size=4, cost_of=lambda models: sum(costs[m] for m in models))
+
+    # The oldest entry was expensive to produce, the next one was free
+    cache.set("p0", "v0", models_used=["expensive"])
+    cache.set("p1", "v1", models_used=["cheap"])
+    cache.set("p2", "v2", models_used=["cheap"])
+    cache.set("p3", "v3", models_used=["cheap"])
+    cache.set("p4", "v4", models_used=["cheap"])
+
+    assert cache.get("p0") == "v0"
+    assert cache.get("p1") is None
+    assert cache.get_stats()["evictions"] == 1
+    print("[OK] Expensive LRU entry kept, cheap one evicted")
+
+    # Hits count as value too: p2 is now least recent but often reused
+    for _ in range(3):
+        cache.get("p2")
+    for prompt in ("p3", "p4", "p0"):
+        cache.get(prompt)
+    cache.set("p5", "v5", models_used=["cheap"])
+    assert cache.get("p2") == "v2"
+    assert cache.get("p3") is None
+    print("[OK] Often reused entry kept over a less used one")
+
+
+if __name__ == "__main__":
+    test_ttl_expiry_with_tick_clock()
+    test_single_flight_with_cancellation()
+    test_value_aware_eviction()
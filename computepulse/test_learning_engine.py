@@ -150,5 +150,45 @@ def test_learning_engine():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+
+def test_scores_persist_after_one_update():
+    """A single score update is on disk without an explicit flush."""
+    temp_dir = tempfile.mkdtemp()
+    
+    try:
+        config = OrchestratorConfig(storage_dir=temp_dir)
+        engine = LearningEngine(StorageManager(config))
+        
+        for i in range(15):
+            engine.record_performance(
+                model_name="qwen",
+                task_type=TaskType.SIMPLE_QUERY,
+                was_correct=i % 4 != 0,
+                response_time=1.0,
+                cost=0.001,
+            )
+        engine.update_confidence_scores()
+        score = engine.get_confidence_score("qwen", TaskType.SIMPLE_QUERY)
+        
+        # A fresh engine on the same storage sees the updated score and EWMA
+        reloaded = LearningEngine(StorageManager(config))
+        assert reloaded.get_confidence_score("qwen", TaskType.SIMPLE_QUERY) == score
+        key = ("qwen", TaskType.SIMPLE_QUERY)
+        assert reloaded._confidence_scores[key].ewma_samples == 15
+        
+        # Changes batched within the save interval are written by flush()
+        engine.apply_feedback("qwen", TaskType.SIMPLE_QUERY, was_correct=False)
+        engine.flush()
+        reloaded = LearningEngine(StorageManager(config))
+        assert reloaded.get_confidence_score("qwen", TaskType.SIMPLE_QUERY) == (
+            engine.get_confidence_score("qwen", TaskType.SIMPLE_QUERY)
+        )
+        print("[OK] Confidence scores persist across reload")
+        
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 if __name__ == "__main__":
     test_learning_engine()
+    test_scores_persist_after_one_update()
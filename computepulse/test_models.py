@@ -0,0 +1,154 @@
+"""
+Test script for the data models (slotted dataclasses and fast_init).
+"""
+
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_orchestrator.models import (
+    AIModel,
+    ConfidenceScore,
+    MergedResult,
+    PerformanceRecord,
+    Response,
+    TaskType,
+    ValidationError,
+)
+
+
+def expect_validation_error(factory, **kwargs):
+    """Assert that building a model with kwargs raises ValidationError."""
+    try:
+        factory(**kwargs)
+    except ValidationError:
+        return
+    raise AssertionError(f"{factory.__name__}({kwargs}) did not raise ValidationError")
+
+
+def test_slotted_models():
+    """Slotted models keep their fields, defaults and equality."""
+    print("=" * 60)
+    print("Slotted Model Test")
+    print("=" * 60)
+
+    response = Response(
+        model_name="qwen",
+        content="ok",
+        response_time=1.5,
+        token_count=10,
+        cost=0.001,
+    )
+    assert not hasattr(response, "__dict__")
+    assert "content" in Response.__slots__
+    try:
+        response.extra = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("slotted Response accepted an unknown attribute")
+    print("[OK] Response has slots and no __dict__")
+
+    # Defaults come from the generated __init__, factories run per instance
+    assert response.success is True
+    assert response.error is None
+    assert isinstance(response.timestamp, datetime)
+    assert Response("qwen", "ok", 1.5, 10, 0.001, response.timestamp) == response
+    print("[OK] Response defaults and positional construction")
+
+    record = PerformanceRecord(
+        timestamp=datetime(2024, 1, 1),
+        model_name="qwen",
+        task_type=TaskType.SIMPLE_QUERY,
+        was_correct=True,
+        response_time=1.0,
+        cost=0.0,
+        token_count=5,
+    )
+    assert record.request_id is None
+    assert PerformanceRecord.from_json(record.to_json()) == record
+    print("[OK] PerformanceRecord defaults and JSON round trip")
+
+    score = ConfidenceScore(model_name="qwen", task_type=TaskType.SIMPLE_QUERY, score=0.8)
+    assert not hasattr(score, "__dict__")
+    assert score.storage_key == "qwen_simple_query"
+    assert score.sample_count == 0 and score.ewma_samples == 0
+    print("[OK] ConfidenceScore defaults and storage key")
+
+    merged = MergedResult(data=[1], contributing_models=["qwen", "glm"], confidence_scores={})
+    assert merged.contributing_models == ("qwen", "glm")
+    assert merged.metadata == {} and merged.flagged_for_review is False
+    print("[OK] MergedResult coerces contributing models to a tuple")
+
+
+def test_fast_init_validation():
+    """fast_init sends anything its inline check rejects through validate()."""
+    print("=" * 60)
+    print("fast_init Validation Test")
+    print("=" * 60)
+
+    valid = dict(model_name="qwen", content="ok", response_time=1.0, token_count=1, cost=0.0)
+    expect_validation_error(Response, **dict(valid, model_name=""))
+    expect_validation_error(Response, **dict(valid, response_time=-1.0))
+    expect_validation_error(Response, **dict(valid, token_count=-1))
+    expect_validation_error(Response, **dict(valid, cost="free"))
+    print("[OK] Invalid responses raise ValidationError")
+
+    # Values outside the fast path that validate() accepts are kept
+    response = Response(**dict(valid, response_time=2, cost=0))
+    assert response.response_time == 2 and response.cost == 0
+    print("[OK] Integer times and costs pass full validation")
+
+    record = dict(
+        timestamp=datetime(2024, 1, 1),
+        model_name="qwen",
+        task_type=TaskType.SIMPLE_QUERY,
+        was_correct=True,
+        response_time=1.0,
+        cost=0.0,
+        token_count=5,
+    )
+    expect_validation_error(PerformanceRecord, **dict(record, task_type="simple_query"))
+    expect_validation_error(PerformanceRecord, **dict(record, was_correct=1))
+    print("[OK] Invalid performance records raise ValidationError")
+
+    expect_validation_error(
+        ConfidenceScore, model_name="qwen", task_type=TaskType.SIMPLE_QUERY, score=1.5
+    )
+    expect_validation_error(
+        MergedResult, data=None, contributing_models=(), confidence_scores={"qwen": -0.1}
+    )
+    print("[OK] Out-of-range scores raise ValidationError")
+
+
+def test_ai_model_derived_fields():
+    """AIModel keeps its derived per-request cost in step with its price."""
+    print("=" * 60)
+    print("AIModel Test")
+    print("=" * 60)
+
+    model = AIModel(name="qwen", provider="Alibaba", cost_per_1m_tokens=0.6, avg_response_time=3.5)
+    assert abs(model.cost_per_request - 0.0006) < 1e-12
+    model.cost_per_1m_tokens = 100.0
+    assert abs(model.cost_per_request - 0.1) < 1e-12
+    print("[OK] cost_per_request follows cost_per_1m_tokens")
+
+    models = {model}
+    try:
+        model.name = "glm"
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("AIModel.name was reassigned")
+    model.enabled = False
+    assert model.name == "qwen" and model in models
+    assert hash(model) == hash("qwen")
+    print("[OK] name is read-only, other fields stay mutable")
+
+
+if __name__ == "__main__":
+    test_slotted_models()
+    test_fast_init_validation()
+    test_ai_model_derived_fields()